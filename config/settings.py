@@ -102,6 +102,9 @@ def get_default_config() -> Dict[str, Any]:
             'images_dir': 'detections/images',
             'exports_dir': 'exports',
             'max_storage_days': 30,
+            'max_storage_mb': 0,
+            'upper_watermark': 0.9,
+            'lower_watermark': 0.85,
             'auto_cleanup': True
         },
         'zones': [],
@@ -5,6 +5,7 @@
 Module pour la visualisation des détections
 """
 
+import sys
 import cv2
 import numpy as np
 from datetime import datetime
@@ -16,6 +17,11 @@ from PyQt6.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QMouseEvent
 
 from utils.logger import get_module_logger
 
+# Sur les machines little-endian, un tampon BGRA correspond exactement à la disposition
+# mémoire des formats ARGB32 de Qt (sans reconditionnement à l'affichage). Le format
+# ARGB32_Premultiplied est utilisé: équivalent ici, COLOR_BGR2BGRA fixant l'alpha à 255
+_NATIVE_ARGB32 = sys.byteorder == 'little'
+
 class DetectionView(QWidget):
     """Widget personnalisé pour afficher la vidéo et les zones de détection"""
     
@@ -48,6 +54,12 @@ class DetectionView(QWidget):
         self.frame_size = (640, 480)
         self.mutex = QMutex()
         
+        # Tampons persistants réutilisés d'une frame à l'autre (réalloués si la taille change)
+        self._display_buf: Optional[np.ndarray] = None
+        self._resize_buf: Optional[np.ndarray] = None
+        self._bgra_buf: Optional[np.ndarray] = None
+        self._last_qimage: Optional[QImage] = None
+        
         # Charger les zones depuis la configuration
         self._load_zones()
         
@@ -257,7 +269,7 @@ class DetectionView(QWidget):
         try:
             # Si une frame est fournie, la sauvegarder
             if frame is not None and frame.size > 0:
-                self.current_frame = frame.copy()
+                self.current_frame = self._copy_into(self.current_frame, frame)
                 
                 # Mettre à jour la taille de frame
                 h, w = frame.shape[:2]
@@ -268,8 +280,9 @@ class DetectionView(QWidget):
                 self.mutex.unlock()
                 return
             
-            # Créer une copie pour l'affichage
-            display_frame = self.current_frame.copy()
+            # Copier dans le tampon d'affichage persistant
+            self._display_buf = self._copy_into(self._display_buf, self.current_frame)
+            display_frame = self._display_buf
         except Exception as e:
             self.logger.error(f"Erreur lors de la préparation de la frame: {str(e)}")
             self.mutex.unlock()
@@ -290,7 +303,7 @@ class DetectionView(QWidget):
             self._add_overlay(display_frame, metadata)
             
             # Sauvegarder la frame d'affichage
-            self.display_frame = display_frame.copy()
+            self.display_frame = display_frame
             
             # Afficher la frame
             self._display_frame(display_frame)
@@ -299,6 +312,23 @@ class DetectionView(QWidget):
         finally:
             self.mutex.unlock()
     
+    @staticmethod
+    def _copy_into(buffer: Optional[np.ndarray], frame: np.ndarray) -> np.ndarray:
+        """
+        Copie une frame dans un tampon existant, réalloué uniquement si sa forme change
+        
+        Args:
+            buffer: Tampon à réutiliser (ou None)
+            frame: Frame à copier
+            
+        Returns:
+            Tampon contenant la copie de la frame
+        """
+        if buffer is None or buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            return frame.copy()
+        np.copyto(buffer, frame)
+        return buffer
+    
     def _draw_zones(self, frame: np.ndarray):
         """
         Dessine les zones de détection existantes
@@ -653,9 +683,9 @@ class DetectionView(QWidget):
             return
         
         try:
-            # Convertir en RGB pour Qt
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_frame.shape
+            # Qt lit directement le tampon BGR d'OpenCV (Format_BGR888), sans conversion en RGB
+            bgr_frame = np.ascontiguousarray(frame)
+            h, w = bgr_frame.shape[:2]
             
             # Appliquer le redimensionnement selon le mode choisi
             resize_mode = self.display_config.get('resize_mode', 'fit')
@@ -708,7 +738,11 @@ class DetectionView(QWidget):
             if display_w != w or display_h != h:
                 try:
                     interpolation = cv2.INTER_NEAREST if self.display_config.get('fast_resize', True) else cv2.INTER_AREA
-                    rgb_frame = cv2.resize(rgb_frame, (display_w, display_h), interpolation=interpolation)
+                    resize_shape = (display_h, display_w) + bgr_frame.shape[2:]
+                    if self._resize_buf is None or self._resize_buf.shape != resize_shape or self._resize_buf.dtype != bgr_frame.dtype:
+                        self._resize_buf = np.empty(resize_shape, dtype=bgr_frame.dtype)
+                    bgr_frame = cv2.resize(bgr_frame, (display_w, display_h), dst=self._resize_buf,
+                                           interpolation=interpolation)
                 except Exception as resize_error:
                     self.logger.error(f"Erreur lors du redimensionnement: {str(resize_error)}")
                     # Utiliser la frame originale en cas d'erreur
@@ -716,8 +750,19 @@ class DetectionView(QWidget):
             
             # Convertir en QImage
             try:
-                bytes_per_line = ch * display_w
-                qt_image = QImage(rgb_frame.data, display_w, display_h, bytes_per_line, QImage.Format.Format_RGB888)
+                if _NATIVE_ARGB32 and bgr_frame.ndim == 3 and bgr_frame.shape[2] == 3 and bgr_frame.dtype == np.uint8:
+                    # BGRA (alpha opaque) dans un tampon persistant: format 32 bits natif de Qt
+                    bgra_shape = bgr_frame.shape[:2] + (4,)
+                    if self._bgra_buf is None or self._bgra_buf.shape != bgra_shape:
+                        self._bgra_buf = np.empty(bgra_shape, dtype=np.uint8)
+                    cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2BGRA, dst=self._bgra_buf)
+                    qt_image = QImage(self._bgra_buf.data, display_w, display_h, self._bgra_buf.strides[0],
+                                      QImage.Format.Format_ARGB32_Premultiplied)
+                else:
+                    bytes_per_line = bgr_frame.strides[0]
+                    qt_image = QImage(bgr_frame.data, display_w, display_h, bytes_per_line, QImage.Format.Format_BGR888)
+                # Conserver l'image (et son tampon) jusqu'à la frame suivante
+                self._last_qimage = qt_image
             except Exception as qimage_error:
                 self.logger.error(f"Erreur lors de la création de QImage: {str(qimage_error)}")
                 return
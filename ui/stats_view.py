@@ -8,17 +8,23 @@ Module d'affichage des statistiques pour DETECTCAM
 import os
 import json
 import csv
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Callable
 
+import numpy as np
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-    QTabWidget, QWidget, QTableWidget, QTableWidgetItem,
+    QTabWidget, QWidget, QTableWidget, QTableWidgetItem, QTableView,
     QComboBox, QDateEdit, QGroupBox, QCheckBox, QFileDialog,
-    QMessageBox, QSplitter, QFrame, QSizePolicy
+    QMessageBox, QSplitter, QFrame, QSizePolicy, QHeaderView
 )
-from PyQt6.QtCore import Qt, QDate, pyqtSignal, pyqtSlot, QSize
-from PyQt6.QtGui import QColor, QFont, QIcon
+from PyQt6.QtCore import (
+    Qt, QDate, pyqtSignal, pyqtSlot, QSize, QAbstractTableModel, QModelIndex
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QIcon
 
 # Import conditionnel de matplotlib pour la visualisation
 try:
@@ -27,13 +33,164 @@ try:
     from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
     from matplotlib.figure import Figure
     import matplotlib.pyplot as plt
-    import numpy as np
     HAS_MATPLOTLIB = True
 except ImportError:
     HAS_MATPLOTLIB = False
 
+# Import conditionnel de ciso8601 pour accélérer l'analyse des horodatages ISO
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+# Import conditionnel d'un encodeur JSON natif pour les exports
+try:
+    import orjson
+    
+    def _dumps_json_bytes(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    try:
+        import ujson
+        
+        def _dumps_json_bytes(data: Any) -> bytes:
+            return ujson.dumps(data, indent=2).encode('utf-8')
+    except ImportError:
+        def _dumps_json_bytes(data: Any) -> bytes:
+            return json.dumps(data, indent=2).encode('utf-8')
+
 from utils.logger import get_module_logger
 
+# Taille du tampon d'écriture pour les exports (1 Mio)
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# Nombre maximal de lignes affichées dans le tableau des données brutes
+_MAX_RAW_ROWS = 1000
+
+
+def _parse_time_cached(value: str, cache: Dict[str, datetime]) -> datetime:
+    """
+    Analyse un horodatage ISO en réutilisant les résultats déjà calculés
+    
+    Args:
+        value: Chaîne ISO à analyser
+        cache: Dictionnaire de cache (chaîne ISO -> datetime), propre à l'appelant
+        
+    Returns:
+        Date et heure correspondantes
+    """
+    parsed = cache.get(value)
+    if parsed is None:
+        parsed = cache[value] = _parse_iso(value)
+    return parsed
+
+
+def _parse_valid_times(detections: List[Dict[str, Any]],
+                       cache: Dict[str, datetime]) -> List[tuple]:
+    """
+    Associe à chaque détection son horodatage analysé, en écartant les entrées invalides
+    
+    Args:
+        detections: Liste des détections
+        cache: Dictionnaire de cache (chaîne ISO -> datetime), propre à l'appelant
+        
+    Returns:
+        Liste de tuples (datetime, détection)
+    """
+    valid = []
+    for detection in detections:
+        try:
+            valid.append((_parse_time_cached(detection['time'], cache), detection))
+        except (ValueError, KeyError, TypeError):
+            continue
+    return valid
+
+
+def _format_date_time(value: datetime, cache: Dict[datetime, tuple]) -> tuple:
+    """
+    Formate une date en chaînes "AAAA-MM-JJ" et "HH:MM:SS" sans passer par strftime
+    
+    Args:
+        value: Date et heure à formater
+        cache: Dictionnaire de cache (datetime -> (date, heure)), propre à l'appelant
+        
+    Returns:
+        Tuple (date_str, time_str)
+    """
+    formatted = cache.get(value)
+    if formatted is None:
+        formatted = cache[value] = (
+            f"{value.year:04d}-{value.month:02d}-{value.day:02d}",
+            f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+        )
+    return formatted
+
+
+@contextmanager
+def _batch_table_update(table: QTableWidget, row_count: int):
+    """
+    Suspend le rafraîchissement et les signaux d'un tableau pendant son remplissage
+    
+    Args:
+        table: Tableau à remplir
+        row_count: Nombre de lignes à allouer
+    """
+    sorting_enabled = table.isSortingEnabled()
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    table.setSortingEnabled(False)
+    try:
+        # Vider puis allouer toutes les lignes en une seule fois
+        table.setRowCount(0)
+        table.setRowCount(row_count)
+        yield table
+    finally:
+        table.setSortingEnabled(sorting_enabled)
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+
+
+class DetectionTableModel(QAbstractTableModel):
+    """Modèle léger pour le tableau des données brutes de détection"""
+    
+    HEADERS = ["Date", "Heure", "Zone", "Classe", "Confiance"]
+    
+    def __init__(self, parent=None):
+        """Initialise le modèle avec une liste de lignes vide"""
+        super().__init__(parent)
+        self._rows: List[tuple] = []
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+    
+    def set_rows(self, rows: List[tuple]):
+        """
+        Remplace toutes les lignes du modèle en une seule réinitialisation
+        
+        Args:
+            rows: Lignes de chaînes préformatées (date, heure, zone, classe, confiance)
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
 class DetectionHistogram(QWidget):
     """Widget pour afficher un histogramme des détections"""
     
@@ -51,10 +208,11 @@ class DetectionHistogram(QWidget):
         
         layout = QVBoxLayout(self)
         
-        # Créer la figure matplotlib
+        # Créer la figure matplotlib et son axe, réutilisés à chaque tracé
         self.figure = Figure(figsize=(8, 6), dpi=100)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setMinimumHeight(300)
+        self._ax = self.figure.add_subplot(111)
         layout.addWidget(self.canvas)
         
         self.setLayout(layout)
@@ -70,11 +228,9 @@ class DetectionHistogram(QWidget):
         if not HAS_MATPLOTLIB:
             return
         
-        # Effacer la figure
-        self.figure.clear()
-        
-        # Créer un axe
-        ax = self.figure.add_subplot(111)
+        # Réinitialiser l'axe existant plutôt que de recréer la figure
+        ax = self._ax
+        ax.cla()
         
         # Tracer les données
         for label, values in data.items():
@@ -87,8 +243,8 @@ class DetectionHistogram(QWidget):
         ax.set_ylabel("Nombre de détections")
         ax.legend()
         
-        # Mettre à jour le canvas
-        self.canvas.draw()
+        # Planifier le rendu du canvas dans la boucle d'événements
+        self.canvas.draw_idle()
     
     def plot_time_distribution(self, hours: List[int], title: str = "Distribution par heure"):
         """
@@ -101,17 +257,14 @@ class DetectionHistogram(QWidget):
         if not HAS_MATPLOTLIB:
             return
         
-        # Effacer la figure
-        self.figure.clear()
-        
-        # Créer un axe
-        ax = self.figure.add_subplot(111)
+        # Réinitialiser l'axe existant plutôt que de recréer la figure
+        ax = self._ax
+        ax.cla()
         
         # Compter les occurrences de chaque heure
-        hour_counts = [0] * 24
-        for hour in hours:
-            if 0 <= hour < 24:
-                hour_counts[hour] += 1
+        hour_values = np.asarray(hours, dtype=np.int64)
+        hour_values = hour_values[(hour_values >= 0) & (hour_values < 24)]
+        hour_counts = np.bincount(hour_values, minlength=24)
         
         # Tracer le graphique
         x = range(24)
@@ -123,8 +276,8 @@ class DetectionHistogram(QWidget):
         ax.set_ylabel("Nombre de détections")
         ax.set_xticks(range(0, 24, 2))
         
-        # Mettre à jour le canvas
-        self.canvas.draw()
+        # Planifier le rendu du canvas dans la boucle d'événements
+        self.canvas.draw_idle()
     
     def plot_zone_stats(self, zone_data: Dict[str, int], title: str = "Détections par zone"):
         """
@@ -137,11 +290,9 @@ class DetectionHistogram(QWidget):
         if not HAS_MATPLOTLIB:
             return
         
-        # Effacer la figure
-        self.figure.clear()
-        
-        # Créer un axe
-        ax = self.figure.add_subplot(111)
+        # Réinitialiser l'axe existant plutôt que de recréer la figure
+        ax = self._ax
+        ax.cla()
         
         # Trier les données par valeur décroissante
         sorted_data = sorted(zone_data.items(), key=lambda x: x[1], reverse=True)
@@ -165,8 +316,8 @@ class DetectionHistogram(QWidget):
         # Ajuster les étiquettes
         ax.tick_params(axis='y', labelsize=8)
         
-        # Mettre à jour le canvas
-        self.canvas.draw()
+        # Planifier le rendu du canvas dans la boucle d'événements
+        self.canvas.draw_idle()
     
     def plot_class_stats(self, class_data: Dict[str, int], title: str = "Détections par classe"):
         """
@@ -179,11 +330,9 @@ class DetectionHistogram(QWidget):
         if not HAS_MATPLOTLIB:
             return
         
-        # Effacer la figure
-        self.figure.clear()
-        
-        # Créer un axe pour le camembert
-        ax = self.figure.add_subplot(111)
+        # Réinitialiser l'axe existant plutôt que de recréer la figure
+        ax = self._ax
+        ax.cla()
         
         # Filtrer les classes avec peu de détections
         threshold = max(class_data.values()) * 0.01  # 1% du maximum
@@ -229,8 +378,8 @@ class DetectionHistogram(QWidget):
         # Ajouter un titre
         ax.set_title(title)
         
-        # Mettre à jour le canvas
-        self.canvas.draw()
+        # Planifier le rendu du canvas dans la boucle d'événements
+        self.canvas.draw_idle()
 
 
 class StatsView(QDialog):
@@ -250,6 +399,8 @@ class StatsView(QDialog):
         
         # Charger les données existantes
         self.detection_history = []
+        self._filter_cache = None
+        self._stats_cache = None
         self.load_detection_history()
         
         # Initialiser l'interface utilisateur
@@ -277,6 +428,7 @@ class StatsView(QDialog):
             "Aujourd'hui", "7 derniers jours", "30 derniers jours", 
             "Mois dernier", "Année dernière", "Tout"
         ])
+        self.period_combo.currentIndexChanged.connect(self._invalidate_filter_cache)
         self.period_combo.currentIndexChanged.connect(self.update_stats)
         
         # Date de début et fin
@@ -301,6 +453,7 @@ class StatsView(QDialog):
             zone_name = self.config.get('zone_names', {}).get(str(i), f"Zone {i+1}")
             self.zone_combo.addItem(zone_name)
         
+        self.zone_combo.currentIndexChanged.connect(self._invalidate_filter_cache)
         self.zone_combo.currentIndexChanged.connect(self.update_stats)
         
         # Classe d'objet
@@ -310,10 +463,12 @@ class StatsView(QDialog):
         self.class_combo.addItems([
             "personne", "véhicule", "animal", "objet"
         ])
+        self.class_combo.currentIndexChanged.connect(self._invalidate_filter_cache)
         self.class_combo.currentIndexChanged.connect(self.update_stats)
         
         # Bouton d'actualisation
         refresh_btn = QPushButton("Actualiser")
+        refresh_btn.clicked.connect(self._invalidate_filter_cache)
         refresh_btn.clicked.connect(self.update_stats)
         
         # Ajouter les filtres au layout
@@ -424,10 +579,11 @@ class StatsView(QDialog):
         data_layout = QVBoxLayout(data_tab)
         
         # Tableau des données brutes
-        self.data_table = QTableWidget()
-        self.data_table.setColumnCount(5)
-        self.data_table.setHorizontalHeaderLabels(["Date", "Heure", "Zone", "Classe", "Confiance"])
+        self.data_model = DetectionTableModel(self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.data_model)
         self.data_table.horizontalHeader().setStretchLastSection(True)
+        self._init_data_table_columns()
         
         data_layout.addWidget(self.data_table)
         
@@ -464,26 +620,73 @@ class StatsView(QDialog):
         
         self.setLayout(main_layout)
     
+    def _init_data_table_columns(self):
+        """Fixe une fois pour toutes la largeur des colonnes du tableau des données brutes"""
+        metrics = QFontMetrics(self.data_table.font())
+        
+        # Nom de zone le plus long connu
+        zone_samples = ["Toute l'image"] + [
+            self.zone_combo.itemText(i) for i in range(1, self.zone_combo.count())
+        ]
+        
+        samples = [
+            "0000-00-00",
+            "00:00:00",
+            max(zone_samples, key=metrics.horizontalAdvance),
+            "ordinateur portable",
+        ]
+        
+        header = self.data_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        padding = metrics.horizontalAdvance("    ")
+        for column, sample in enumerate(samples):
+            self.data_table.setColumnWidth(column, metrics.horizontalAdvance(sample) + padding)
+    
     def load_detection_history(self):
         """Charge l'historique des détections"""
+        self._invalidate_filter_cache()
         try:
-            # Charger depuis un fichier JSON ou une base de données
-            history_file = os.path.join(
-                self.config.get('storage', {}).get('base_dir', 'detections'),
-                'detection_history.json'
-            )
+            # Charger l'instantané JSON puis les ajouts journalisés depuis (NDJSON)
+            base_dir = self.config.get('storage', {}).get('base_dir', 'detections')
+            history_file = os.path.join(base_dir, 'detection_history.json')
+            history_log_file = os.path.join(base_dir, 'detection_history.ndjson')
             
-            if os.path.exists(history_file):
-                with open(history_file, 'r', encoding='utf-8') as f:
-                    self.detection_history = json.load(f)
-                    
-                    self.logger.info(f"Historique de détection chargé: {len(self.detection_history)} entrées")
+            if os.path.exists(history_file) or os.path.exists(history_log_file):
+                history = []
+                if os.path.exists(history_file):
+                    with open(history_file, 'r', encoding='utf-8') as f:
+                        history = json.load(f)
+                
+                if os.path.exists(history_log_file):
+                    with open(history_log_file, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            try:
+                                history.append(json.loads(line))
+                            except ValueError:
+                                # Ligne vide ou tronquée
+                                continue
+                
+                self.detection_history = history
+                
+                # Normaliser la confiance une fois pour toutes (valeur numérique garantie)
+                for detection in self.detection_history:
+                    try:
+                        detection['confidence'] = float(detection.get('confidence') or 0.0)
+                    except (TypeError, ValueError):
+                        detection['confidence'] = 0.0
+                
+                self.logger.info(f"Historique de détection chargé: {len(self.detection_history)} entrées")
             else:
                 self.logger.warning(f"Fichier d'historique non trouvé: {history_file}")
         except Exception as e:
             self.logger.error(f"Erreur lors du chargement de l'historique: {str(e)}")
             self.detection_history = []
     
+    def _invalidate_filter_cache(self):
+        """Invalide le cache du filtrage de l'historique et des statistiques dérivées"""
+        self._filter_cache = None
+        self._stats_cache = None
+    
     def update_stats(self):
         """Met à jour les statistiques affichées selon les filtres"""
         # Filtrer les données selon la période
@@ -516,11 +719,20 @@ class StatsView(QDialog):
         Returns:
             Liste filtrée des détections
         """
+        period = self.period_combo.currentText()
+        zone_filter = self.zone_combo.currentIndex() - 1  # -1 = Toutes les zones
+        class_filter = self.class_combo.currentText()
+        
+        # Réutiliser le dernier résultat si les filtres n'ont pas changé
+        params = (period, zone_filter, class_filter)
+        if self._filter_cache is not None and self._filter_cache[0] == params:
+            return self._filter_cache[1]
+        
         result = []
+        timed = []
+        parse_cache = {}
         
         # Déterminer les dates de début et de fin
-        period = self.period_combo.currentText()
-        
         if period == "Aujourd'hui":
             start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
             end_date = datetime.now()
@@ -548,11 +760,7 @@ class StatsView(QDialog):
             start_date = datetime.fromtimestamp(0)  # Début des temps UNIX
             end_date = datetime.now()
         
-        # Filtrer par zone
-        zone_filter = self.zone_combo.currentIndex() - 1  # -1 = Toutes les zones
-        
         # Filtrer par classe
-        class_filter = self.class_combo.currentText()
         if class_filter == "Toutes les classes":
             class_filter = None
         
@@ -560,7 +768,7 @@ class StatsView(QDialog):
         for detection in self.detection_history:
             try:
                 # Vérifier la date
-                detection_time = datetime.fromisoformat(detection['time'])
+                detection_time = _parse_time_cached(detection['time'], parse_cache)
                 if not (start_date <= detection_time <= end_date):
                     continue
                 
@@ -588,12 +796,47 @@ class StatsView(QDialog):
                 
                 # Ajouter à la liste filtrée
                 result.append(detection)
+                timed.append((detection_time, detection))
                 
             except (ValueError, KeyError):
                 continue
         
+        # Trier une seule fois par date (récent d'abord) pour tous les consommateurs
+        timed.sort(key=itemgetter(0), reverse=True)
+        
+        self._filter_cache = (params, result, timed)
         return result
     
+    def _timed_detections(self, filtered_data: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        Retourne les détections filtrées associées à leur horodatage, triées par date décroissante
+        
+        Args:
+            filtered_data: Liste des détections filtrées
+            
+        Returns:
+            Liste de tuples (datetime, détection)
+        """
+        if self._filter_cache is not None and self._filter_cache[1] is filtered_data:
+            return self._filter_cache[2]
+        
+        timed = _parse_valid_times(filtered_data, {})
+        timed.sort(key=itemgetter(0), reverse=True)
+        return timed
+    
+    def _build_zone_resolver(self) -> Dict[str, str]:
+        """
+        Construit la table de correspondance clé de zone -> nom affiché
+        
+        Returns:
+            Dictionnaire des noms de zones à afficher
+        """
+        zone_names = self.config.get('zone_names', {})
+        resolver = {"global": "Toute l'image", "inconnu": "Toute l'image"}
+        for i, _ in enumerate(self.config.get('zones', [])):
+            resolver[str(i)] = zone_names.get(str(i), f"Zone {i+1}")
+        return resolver
+    
     def _show_empty_stats(self):
         """Affiche des statistiques vides"""
         # Statistiques globales
@@ -603,8 +846,9 @@ class StatsView(QDialog):
         self.peak_hour_label.setText("Heure de pointe: -")
         
         # Tableaux
-        for table in [self.zones_table, self.time_table, self.class_table, self.data_table]:
+        for table in [self.zones_table, self.time_table, self.class_table]:
             table.setRowCount(0)
+        self.data_model.set_rows([])
         
         # Histogrammes
         if HAS_MATPLOTLIB:
@@ -628,7 +872,7 @@ class StatsView(QDialog):
         detections_by_day = {}
         for detection in filtered_data:
             try:
-                detection_time = datetime.fromisoformat(detection['time'])
+                detection_time = _parse_iso(detection['time'])
                 day_key = detection_time.strftime("%Y-%m-%d")
                 
                 if day_key not in detections_by_day:
@@ -655,7 +899,7 @@ class StatsView(QDialog):
         detections_by_hour = {}
         for detection in filtered_data:
             try:
-                detection_time = datetime.fromisoformat(detection['time'])
+                detection_time = _parse_iso(detection['time'])
                 hour_key = detection_time.hour
                 
                 if hour_key not in detections_by_hour:
@@ -738,36 +982,32 @@ class StatsView(QDialog):
             except (ValueError, KeyError):
                 continue
         
-        # Mise à jour du tableau
-        self.zones_table.setRowCount(len(detections_by_zone))
-        
         total_detections = len(filtered_data)
         row = 0
         
-        zone_names = {}
-        for i, _ in enumerate(self.config.get('zones', [])):
-            zone_names[str(i)] = self.config.get('zone_names', {}).get(str(i), f"Zone {i+1}")
+        zone_resolver = self._build_zone_resolver()
         
         # Trier par nombre de détections (décroissant)
         sorted_zones = sorted(detections_by_zone.items(), key=lambda x: x[1], reverse=True)
         
-        for zone_key, count in sorted_zones:
-            # Nom de la zone
-            if zone_key == "global" or zone_key == "inconnu":
-                zone_name = "Toute l'image"
-            else:
-                # Obtenir le nom de la zone depuis la configuration
-                zone_name = zone_names.get(zone_key, f"Zone {zone_key}")
-            
-            # Calculer le pourcentage
-            percent = (count / total_detections * 100) if total_detections > 0 else 0
-            
-            # Remplir le tableau
-            self.zones_table.setItem(row, 0, QTableWidgetItem(zone_name))
-            self.zones_table.setItem(row, 1, QTableWidgetItem(str(count)))
-            self.zones_table.setItem(row, 2, QTableWidgetItem(f"{percent:.1f}%"))
-            
-            row += 1
+        # Mise à jour du tableau
+        set_item = self.zones_table.setItem
+        item = QTableWidgetItem
+        
+        with _batch_table_update(self.zones_table, len(detections_by_zone)):
+            for zone_key, count in sorted_zones:
+                # Nom de la zone
+                zone_name = zone_resolver.get(zone_key) or f"Zone {zone_key}"
+                
+                # Calculer le pourcentage
+                percent = (count / total_detections * 100) if total_detections > 0 else 0
+                
+                # Remplir le tableau
+                set_item(row, 0, item(zone_name))
+                set_item(row, 1, item(str(count)))
+                set_item(row, 2, item(f"{percent:.1f}%"))
+                
+                row += 1
         
         # Ajuster les colonnes
         self.zones_table.resizeColumnsToContents()
@@ -777,63 +1017,100 @@ class StatsView(QDialog):
             # Préparer les données pour l'histogramme
             zone_data = {}
             for zone_key, count in sorted_zones:
-                if zone_key == "global" or zone_key == "inconnu":
-                    zone_name = "Toute l'image"
-                else:
-                    zone_name = zone_names.get(zone_key, f"Zone {zone_key}")
+                zone_name = zone_resolver.get(zone_key) or f"Zone {zone_key}"
                 zone_data[zone_name] = count
             
             # Tracer l'histogramme
             self.zones_histogram.plot_zone_stats(zone_data, "Détections par zone")
     
-    def _update_time_stats(self, filtered_data: List[Dict[str, Any]]):
+    def _compute_all_stats(self, filtered_data: List[Dict[str, Any]]) -> tuple:
         """
-        Met à jour les statistiques par heure
+        Calcule en une seule passe les statistiques par heure, par classe et les données brutes
         
         Args:
             filtered_data: Liste des détections filtrées
+            
+        Returns:
+            Tuple (heures, comptes par heure, comptes par classe, lignes du tableau brut)
         """
-        # Regrouper par heure
-        detections_by_hour = {}
+        if self._stats_cache is not None and self._stats_cache[0] is filtered_data:
+            return self._stats_cache[1]
+        
+        # Récupérer les noms des zones
+        resolve_zone = self._build_zone_resolver().get
+        
         detection_hours = []
+        detections_by_class = Counter()
+        rows = []
+        format_cache = {}
         
-        for detection in filtered_data:
-            try:
-                detection_time = datetime.fromisoformat(detection['time'])
-                hour = detection_time.hour
-                detection_hours.append(hour)
-                
-                if hour not in detections_by_hour:
-                    detections_by_hour[hour] = 0
-                
-                detections_by_hour[hour] += 1
-            except (ValueError, KeyError):
+        # Données déjà triées par date (récent d'abord) lors du filtrage
+        for index, (detection_time, detection) in enumerate(self._timed_detections(filtered_data)):
+            class_name = detection.get('class_name', "inconnu")
+            
+            detection_hours.append(detection_time.hour)
+            detections_by_class[class_name] += 1
+            
+            # Limiter les données brutes à 1000 entrées pour les performances
+            if index >= _MAX_RAW_ROWS:
                 continue
+            
+            # Extraire les données
+            date_str, time_str = _format_date_time(detection_time, format_cache)
+            
+            # Zone
+            zone_key = str(detection.get('zone', "inconnu"))
+            zone_display = resolve_zone(zone_key) or f"Zone {zone_key}"
+            
+            # Confiance
+            confidence_str = f"{detection.get('confidence', 0.0):.2f}"
+            
+            rows.append((date_str, time_str, zone_display, class_name, confidence_str))
         
-        # Mise à jour du tableau
-        self.time_table.setRowCount(24)  # 24 heures
+        # Regrouper par heure en une seule passe vectorisée
+        hours = np.fromiter(detection_hours, dtype=np.int8, count=len(detection_hours))
+        hour_counts = np.bincount(hours, minlength=24)
+        
+        result = (hours, hour_counts, detections_by_class, rows)
+        self._stats_cache = (filtered_data, result)
+        return result
+    
+    def _update_time_stats(self, filtered_data: List[Dict[str, Any]]):
+        """
+        Met à jour les statistiques par heure
+        
+        Args:
+            filtered_data: Liste des détections filtrées
+        """
+        # Statistiques calculées en une seule passe avec les autres onglets
+        hours, hour_counts, _, _ = self._compute_all_stats(filtered_data)
         
         total_detections = len(filtered_data)
         
-        for hour in range(24):
-            count = detections_by_hour.get(hour, 0)
-            percent = (count / total_detections * 100) if total_detections > 0 else 0
-            
-            # Formater l'heure
-            hour_display = f"{hour:02d}h - {(hour+1)%24:02d}h"
-            
-            # Remplir le tableau
-            self.time_table.setItem(hour, 0, QTableWidgetItem(hour_display))
-            self.time_table.setItem(hour, 1, QTableWidgetItem(str(count)))
-            self.time_table.setItem(hour, 2, QTableWidgetItem(f"{percent:.1f}%"))
+        # Mise à jour du tableau (24 heures)
+        set_item = self.time_table.setItem
+        item = QTableWidgetItem
+        
+        with _batch_table_update(self.time_table, 24):
+            for hour in range(24):
+                count = int(hour_counts[hour])
+                percent = (count / total_detections * 100) if total_detections > 0 else 0
+                
+                # Formater l'heure
+                hour_display = f"{hour:02d}h - {(hour+1)%24:02d}h"
+                
+                # Remplir le tableau
+                set_item(hour, 0, item(hour_display))
+                set_item(hour, 1, item(str(count)))
+                set_item(hour, 2, item(f"{percent:.1f}%"))
         
         # Ajuster les colonnes
         self.time_table.resizeColumnsToContents()
         
         # Histogramme des heures
-        if HAS_MATPLOTLIB and detection_hours:
+        if HAS_MATPLOTLIB and len(hours):
             # Tracer l'histogramme
-            self.time_histogram.plot_time_distribution(detection_hours, "Distribution par heure")
+            self.time_histogram.plot_time_distribution(hours, "Distribution par heure")
     
     def _update_class_stats(self, filtered_data: List[Dict[str, Any]]):
         """
@@ -842,38 +1119,30 @@ class StatsView(QDialog):
         Args:
             filtered_data: Liste des détections filtrées
         """
-        # Regrouper par classe
-        detections_by_class = {}
-        for detection in filtered_data:
-            try:
-                class_name = detection.get('class_name', "inconnu")
-                
-                if class_name not in detections_by_class:
-                    detections_by_class[class_name] = 0
-                
-                detections_by_class[class_name] += 1
-            except (ValueError, KeyError):
-                continue
-        
-        # Mise à jour du tableau
-        self.class_table.setRowCount(len(detections_by_class))
+        # Statistiques calculées en une seule passe avec les autres onglets
+        _, _, detections_by_class, _ = self._compute_all_stats(filtered_data)
         
         total_detections = len(filtered_data)
         row = 0
         
         # Trier par nombre de détections (décroissant)
-        sorted_classes = sorted(detections_by_class.items(), key=lambda x: x[1], reverse=True)
+        sorted_classes = detections_by_class.most_common()
         
-        for class_name, count in sorted_classes:
-            # Calculer le pourcentage
-            percent = (count / total_detections * 100) if total_detections > 0 else 0
-            
-            # Remplir le tableau
-            self.class_table.setItem(row, 0, QTableWidgetItem(class_name))
-            self.class_table.setItem(row, 1, QTableWidgetItem(str(count)))
-            self.class_table.setItem(row, 2, QTableWidgetItem(f"{percent:.1f}%"))
-            
-            row += 1
+        # Mise à jour du tableau
+        set_item = self.class_table.setItem
+        item = QTableWidgetItem
+        
+        with _batch_table_update(self.class_table, len(detections_by_class)):
+            for class_name, count in sorted_classes:
+                # Calculer le pourcentage
+                percent = (count / total_detections * 100) if total_detections > 0 else 0
+                
+                # Remplir le tableau
+                set_item(row, 0, item(class_name))
+                set_item(row, 1, item(str(count)))
+                set_item(row, 2, item(f"{percent:.1f}%"))
+                
+                row += 1
         
         # Ajuster les colonnes
         self.class_table.resizeColumnsToContents()
@@ -890,161 +1159,130 @@ class StatsView(QDialog):
         Args:
             filtered_data: Liste des détections filtrées
         """
-        # Limiter à 1000 entrées pour les performances
-        max_rows = min(1000, len(filtered_data))
-        self.data_table.setRowCount(max_rows)
+        # Lignes préformatées lors de la passe unique de calcul des statistiques
+        _, _, _, rows = self._compute_all_stats(filtered_data)
         
-        # Récupérer les noms des zones
-        zone_names = {}
-        for i, _ in enumerate(self.config.get('zones', [])):
-            zone_names[str(i)] = self.config.get('zone_names', {}).get(str(i), f"Zone {i+1}")
+        # Remplir le tableau en une seule réinitialisation du modèle
+        # (largeurs de colonnes fixées à l'initialisation)
+        self.data_model.set_rows(rows)
+    
+    def _iter_csv_rows(self, filtered_data: List[Dict[str, Any]]):
+        """
+        Génère les lignes de l'export CSV, en ignorant les entrées invalides
         
-        # Trier par date (récent d'abord)
-        sorted_data = sorted(filtered_data, 
-                            key=lambda x: datetime.fromisoformat(x.get('time', '1970-01-01T00:00:00')),
-                            reverse=True)
+        Args:
+            filtered_data: Liste des détections filtrées
+            
+        Yields:
+            Tuple (date, heure, zone, classe, confiance, coordonnées)
+        """
+        # Récupérer les noms des zones
+        resolve_zone = self._build_zone_resolver().get
         
-        # Limiter les données
-        display_data = sorted_data[:max_rows]
+        format_cache = {}
+        # Ordre chronologique (les données filtrées sont triées du plus récent au plus ancien)
+        for detection_time, detection in reversed(self._timed_detections(filtered_data)):
+            # Extraire les données
+            date_str, time_str = _format_date_time(detection_time, format_cache)
+            
+            # Zone
+            zone_key = str(detection.get('zone', "inconnu"))
+            zone_display = resolve_zone(zone_key) or f"Zone {zone_key}"
+            
+            # Classe
+            class_name = detection.get('class_name', "inconnu")
+            
+            # Confiance
+            confidence_str = f"{detection.get('confidence', 0.0):.2f}"
+            
+            # Coordonnées
+            center = detection.get('center', (0, 0))
+            coords = f"{center[0]},{center[1]}"
+            
+            yield (date_str, time_str, zone_display, class_name, confidence_str, coords)
+    
+    def _prepare_export(self, ext: str) -> Optional[tuple]:
+        """
+        Prépare un export : filtre les données et demande le chemin du fichier
         
-        for row, detection in enumerate(display_data):
-            try:
-                # Extraire les données
-                detection_time = datetime.fromisoformat(detection.get('time', ''))
-                date_str = detection_time.strftime("%Y-%m-%d")
-                time_str = detection_time.strftime("%H:%M:%S")
-                
-                # Zone
-                zone_key = str(detection.get('zone', "inconnu"))
-                if zone_key == "global" or zone_key == "inconnu":
-                    zone_display = "Toute l'image"
-                else:
-                    zone_display = zone_names.get(zone_key, f"Zone {zone_key}")
-                
-                # Classe
-                class_name = detection.get('class_name', "inconnu")
-                
-                # Confiance
-                confidence = detection.get('confidence', 0.0)
-                confidence_str = f"{confidence:.2f}" if isinstance(confidence, (int, float)) else str(confidence)
-                
-                # Remplir le tableau
-                self.data_table.setItem(row, 0, QTableWidgetItem(date_str))
-                self.data_table.setItem(row, 1, QTableWidgetItem(time_str))
-                self.data_table.setItem(row, 2, QTableWidgetItem(zone_display))
-                self.data_table.setItem(row, 3, QTableWidgetItem(class_name))
-                self.data_table.setItem(row, 4, QTableWidgetItem(confidence_str))
-                
-            except (ValueError, KeyError):
-                # Ignorer les entrées invalides
-                continue
+        Args:
+            ext: Extension du fichier (ex: '.csv')
+            
+        Returns:
+            Tuple (chemin du fichier, données filtrées) ou None si l'export est annulé
+        """
+        label = ext[1:].upper()
         
-        # Ajuster les colonnes
-        self.data_table.resizeColumnsToContents()
-    
-    def export_csv(self):
-        """Exporte les données filtrées au format CSV"""
         # Filtrer les données
         filtered_data = self._filter_detection_history()
         
         if not filtered_data:
-            QMessageBox.warning(self, "Export CSV", "Aucune donnée à exporter.")
-            return
+            QMessageBox.warning(self, f"Export {label}", "Aucune donnée à exporter.")
+            return None
         
         # Demander le chemin du fichier
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Exporter en CSV", "", "Fichiers CSV (*.csv)"
+            self, f"Exporter en {label}", "", f"Fichiers {label} (*{ext})"
         )
         
         if not file_path:
-            return
+            return None
         
-        # Ajouter l'extension .csv si nécessaire
-        if not file_path.endswith('.csv'):
-            file_path += '.csv'
+        # Ajouter l'extension si nécessaire
+        if os.path.splitext(file_path)[1] != ext:
+            file_path += ext
         
-        # Récupérer les noms des zones
-        zone_names = {}
-        for i, _ in enumerate(self.config.get('zones', [])):
-            zone_names[str(i)] = self.config.get('zone_names', {}).get(str(i), f"Zone {i+1}")
-        
-        try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                
-                # En-tête
-                writer.writerow(['Date', 'Heure', 'Zone', 'Classe', 'Confiance', 'Coordonnées'])
-                
-                # Données
-                for detection in filtered_data:
-                    try:
-                        # Extraire les données
-                        detection_time = datetime.fromisoformat(detection.get('time', ''))
-                        date_str = detection_time.strftime("%Y-%m-%d")
-                        time_str = detection_time.strftime("%H:%M:%S")
-                        
-                        # Zone
-                        zone_key = str(detection.get('zone', "inconnu"))
-                        if zone_key == "global" or zone_key == "inconnu":
-                            zone_display = "Toute l'image"
-                        else:
-                            zone_display = zone_names.get(zone_key, f"Zone {zone_key}")
-                        
-                        # Classe
-                        class_name = detection.get('class_name', "inconnu")
-                        
-                        # Confiance
-                        confidence = detection.get('confidence', 0.0)
-                        confidence_str = f"{confidence:.2f}" if isinstance(confidence, (int, float)) else str(confidence)
-                        
-                        # Coordonnées
-                        center = detection.get('center', (0, 0))
-                        coords = f"{center[0]},{center[1]}"
-                        
-                        # Écrire la ligne
-                        writer.writerow([date_str, time_str, zone_display, class_name, confidence_str, coords])
-                        
-                    except (ValueError, KeyError):
-                        # Ignorer les entrées invalides
-                        continue
-            
-            QMessageBox.information(self, "Export CSV", f"Données exportées avec succès dans {file_path}")
-            
-        except Exception as e:
-            self.logger.error(f"Erreur lors de l'export CSV: {str(e)}")
-            QMessageBox.critical(self, "Erreur d'export", f"Impossible d'exporter les données: {str(e)}")
+        return file_path, filtered_data
     
-    def export_json(self):
-        """Exporte les données filtrées au format JSON"""
-        # Filtrer les données
-        filtered_data = self._filter_detection_history()
-        
-        if not filtered_data:
-            QMessageBox.warning(self, "Export JSON", "Aucune donnée à exporter.")
-            return
-        
-        # Demander le chemin du fichier
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Exporter en JSON", "", "Fichiers JSON (*.json)"
-        )
+    def _write_export(self, ext: str, write_fn: Callable[[str, List[Dict[str, Any]]], None]):
+        """
+        Exporte les données filtrées avec la fonction d'écriture propre au format
         
-        if not file_path:
+        Args:
+            ext: Extension du fichier (ex: '.csv')
+            write_fn: Fonction d'écriture (chemin du fichier, données filtrées)
+        """
+        prepared = self._prepare_export(ext)
+        if prepared is None:
             return
         
-        # Ajouter l'extension .json si nécessaire
-        if not file_path.endswith('.json'):
-            file_path += '.json'
+        file_path, filtered_data = prepared
+        label = ext[1:].upper()
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(filtered_data, f, indent=2)
+            write_fn(file_path, filtered_data)
             
-            QMessageBox.information(self, "Export JSON", f"Données exportées avec succès dans {file_path}")
+            QMessageBox.information(self, f"Export {label}", f"Données exportées avec succès dans {file_path}")
             
         except Exception as e:
-            self.logger.error(f"Erreur lors de l'export JSON: {str(e)}")
+            self.logger.error(f"Erreur lors de l'export {label}: {str(e)}")
             QMessageBox.critical(self, "Erreur d'export", f"Impossible d'exporter les données: {str(e)}")
     
+    def _write_csv(self, file_path: str, filtered_data: List[Dict[str, Any]]):
+        """Écrit les données filtrées dans un fichier CSV"""
+        with open(file_path, 'w', newline='', encoding='utf-8',
+                  buffering=_EXPORT_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            
+            # En-tête
+            writer.writerow(['Date', 'Heure', 'Zone', 'Classe', 'Confiance', 'Coordonnées'])
+            
+            # Données (itérées directement par le module C csv)
+            writer.writerows(self._iter_csv_rows(filtered_data))
+    
+    def _write_json(self, file_path: str, filtered_data: List[Dict[str, Any]]):
+        """Écrit les données filtrées dans un fichier JSON"""
+        with open(file_path, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.write(_dumps_json_bytes(filtered_data))
+    
+    def export_csv(self):
+        """Exporte les données filtrées au format CSV"""
+        self._write_export('.csv', self._write_csv)
+    
+    def export_json(self):
+        """Exporte les données filtrées au format JSON"""
+        self._write_export('.json', self._write_json)
+    
     def export_current_chart(self):
         """Exporte le graphique actuel en image"""
         if not HAS_MATPLOTLIB:
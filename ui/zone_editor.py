@@ -8,7 +8,6 @@ Module d'édition des zones de détection pour DETECTCAM
 import cv2
 import numpy as np
 from typing import List, Dict, Any, Tuple, Optional
-from copy import deepcopy
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
@@ -16,17 +15,136 @@ from PyQt6.QtWidgets import (
     QInputDialog, QMessageBox, QMenu, QSplitter, QFrame,
     QSizePolicy, QScrollArea, QComboBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QPoint, QSize
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QPoint, QSize, QTimer, QObject, QThread, QEvent
 from PyQt6.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QMouseEvent, QAction
 
+# Import conditionnel de numba pour compiler les calculs géométriques
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """Remplace numba.njit par un décorateur neutre lorsque numba est absent"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 from utils.logger import get_module_logger
 
+# Espacement et couleur (BGR) de la grille d'aide au dessin
+_GRID_SPACING = 50
+_GRID_COLOR = (200, 200, 200)
+
+
+@njit(cache=True)
+def _label_to_image_coords_core(label_x, label_y, label_width, label_height,
+                                pixmap_width, pixmap_height, image_width, image_height):
+    """
+    Partie arithmétique de la conversion coordonnées QLabel -> coordonnées d'image
+    
+    Returns:
+        Tuple (x, y, valide) dans les coordonnées de l'image
+    """
+    # Calculer les ratios
+    ratio_x = image_width / pixmap_width
+    ratio_y = image_height / pixmap_height
+    
+    # Calculer l'offset pour centrer l'image
+    offset_x = (label_width - pixmap_width) / 2
+    offset_y = (label_height - pixmap_height) / 2
+    
+    # Coordonnées relatives au pixmap
+    pixmap_x = label_x - offset_x
+    pixmap_y = label_y - offset_y
+    
+    # Si les coordonnées sont hors du pixmap, la conversion est invalide
+    if pixmap_x < 0 or pixmap_x >= pixmap_width or pixmap_y < 0 or pixmap_y >= pixmap_height:
+        return -1, -1, False
+    
+    # Convertir en coordonnées d'image
+    image_x = int(pixmap_x * ratio_x)
+    image_y = int(pixmap_y * ratio_y)
+    
+    # Vérifier les limites dans l'image
+    if 0 <= image_x < image_width and 0 <= image_y < image_height:
+        return image_x, image_y, True
+    return -1, -1, False
+
+
+@njit(cache=True)
+def _stamp_circles(buf, points, radius, color):
+    """
+    Dessine des disques pleins directement dans le tampon d'image
+    
+    Args:
+        buf: Image BGR (H, W, 3) uint8 à modifier en place
+        points: Centres des disques, tableau (N, 2) int32 de coordonnées (x, y)
+        radius: Rayon des disques en pixels
+        color: Couleur BGR, tableau (3,) uint8
+    """
+    height = buf.shape[0]
+    width = buf.shape[1]
+    radius_sq = radius * radius
+    
+    for k in range(points.shape[0]):
+        center_x = points[k, 0]
+        center_y = points[k, 1]
+        
+        for y in range(max(center_y - radius, 0), min(center_y + radius + 1, height)):
+            dy = y - center_y
+            for x in range(max(center_x - radius, 0), min(center_x + radius + 1, width)):
+                dx = x - center_x
+                if dx * dx + dy * dy <= radius_sq:
+                    buf[y, x, 0] = color[0]
+                    buf[y, x, 1] = color[1]
+                    buf[y, x, 2] = color[2]
+
+
+class _FrameConverter(QObject):
+    """
+    Convertit les frames numpy en QImage hors du thread principal
+    
+    Le QPixmap est créé par le thread de l'interface à la réception de l'image,
+    QPixmap n'étant pas utilisable en dehors de celui-ci.
+    """
+    
+    # Signal émis lorsque l'image convertie est prête (index du tampon, image)
+    image_ready = pyqtSignal(int, QImage)
+    
+    @pyqtSlot(int, object)
+    def convert(self, buffer_index: int, frame: np.ndarray):
+        """
+        Convertit une frame BGR en QImage (format BGR888, sans conversion de couleurs)
+        
+        Args:
+            buffer_index: Index du tampon d'affichage converti
+            frame: Frame à convertir
+        """
+        try:
+            # Qt lit directement le tampon BGR d'OpenCV (pas de conversion en RGB)
+            frame = np.ascontiguousarray(frame)
+            h, w = frame.shape[:2]
+            
+            # Copier l'image pour qu'elle possède ses données une fois émise vers l'interface
+            qt_image = QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888).copy()
+        except Exception:
+            # Image nulle: l'interface libère la conversion sans changer l'affichage
+            qt_image = QImage()
+        
+        self.image_ready.emit(buffer_index, qt_image)
+
+
 class ZoneEditor(QDialog):
     """
     Éditeur de zones de détection
     Permet de créer, modifier et supprimer des zones
     """
     
+    # Signal de demande de conversion envoyé au thread de conversion (index du tampon, frame)
+    _convert_requested = pyqtSignal(int, object)
+    
     def __init__(self, frame: np.ndarray, 
                  zones: List[np.ndarray] = None, 
                  sensitivities: Dict[str, float] = None,
@@ -55,22 +173,33 @@ class ZoneEditor(QDialog):
             )
         else:
             self.original_frame = frame.copy()
-            
-        self.display_frame = self.original_frame.copy()
+        
+        # Tampons d'affichage préalloués (double tampon: l'un est dessiné pendant
+        # que l'autre est converti par le thread de conversion)
+        self._display_bufs = (np.empty_like(self.original_frame), np.empty_like(self.original_frame))
+        self._display_index = 0
+        self._static_layer = np.empty_like(self.original_frame)
         
         # Copier et vérifier les zones
         self.zones = []
         if zones is not None:
             for zone in zones:
                 if isinstance(zone, np.ndarray) and zone.size >= 6:  # Au moins 3 points (x,y)
-                    self.zones.append(zone.copy())
+                    # Copie int32 contiguë, le format attendu par OpenCV et la détection
+                    self.zones.append(np.array(zone, dtype=np.int32, order='C'))
         
-        # Copier et vérifier les sensibilités
-        self.sensitivities = {}
+        # Tuple des zones valides retourné par get_zones (None: à recalculer)
+        self._zones_cache: Optional[Tuple[np.ndarray, ...]] = None
+        
+        # Copier et vérifier les sensibilités (clés converties en entiers en interne)
+        self.sensitivities: Dict[int, float] = {}
         if sensitivities is not None:
             for key, value in sensitivities.items():
                 if isinstance(value, (int, float)):
-                    self.sensitivities[key] = float(value)
+                    try:
+                        self.sensitivities[int(key)] = float(value)
+                    except (TypeError, ValueError):
+                        self.logger.warning(f"Clé de sensibilité invalide ignorée: {key}")
         
         # État interne
         self.current_zone = []
@@ -80,6 +209,41 @@ class ZoneEditor(QDialog):
         self.draw_grid = False
         self.zone_names = {}
         
+        # Le calque statique (image + grille + zones validées) n'est reconstruit que si nécessaire
+        self._static_dirty = True
+        
+        # Indique si le contenu affiché a changé depuis la dernière conversion en QPixmap
+        self._dirty = True
+        
+        # Cache des polylignes int32 de chaque zone (index de zone -> tableau (N, 1, 2))
+        self._zone_int_cache: Dict[int, np.ndarray] = {}
+        
+        # Cache des dimensions du texte du nom de chaque zone (index de zone -> (largeur, hauteur))
+        self._text_size_cache: Dict[int, Tuple[int, int]] = {}
+        for i in range(len(self.zones)):
+            self._update_text_size(i)
+        
+        # Minuterie de regroupement des rafraîchissements déclenchés par la souris
+        self._render_pending = False
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.timeout.connect(self._on_render_timer)
+        
+        # Géométrie mise en cache (largeur/hauteur du QLabel et du pixmap affiché),
+        # mise à jour au redimensionnement du QLabel et à chaque nouveau pixmap
+        self._pixmap_geom: Optional[Tuple[int, int, int, int]] = None
+        
+        # Thread de conversion des frames en QImage (une seule conversion en cours à la fois)
+        self._conversion_pending = False
+        self._conversion_requeued = False
+        self._converter_thread = QThread(self)
+        self._converter = _FrameConverter()
+        self._converter.moveToThread(self._converter_thread)
+        self._convert_requested.connect(self._converter.convert)
+        self._converter.image_ready.connect(self._on_image_ready)
+        self._converter_thread.finished.connect(self._converter.deleteLater)
+        self._converter_thread.start()
+        
         # Initialiser l'interface utilisateur
         self._init_ui()
         
@@ -109,6 +273,7 @@ class ZoneEditor(QDialog):
         self.image_label.mousePressEvent = self.mouse_press_event
         self.image_label.mouseMoveEvent = self.mouse_move_event
         self.image_label.mouseReleaseEvent = self.mouse_release_event
+        self.image_label.installEventFilter(self)
         
         # Scroll area pour l'image
         scroll_area = QScrollArea()
@@ -125,7 +290,7 @@ class ZoneEditor(QDialog):
         
         self.highlight_check = QCheckBox("Mettre en valeur la zone sélectionnée")
         self.highlight_check.setChecked(True)
-        self.highlight_check.stateChanged.connect(self.update_display)
+        self.highlight_check.stateChanged.connect(self._on_highlight_changed)
         
         display_options.addWidget(self.grid_check)
         display_options.addWidget(self.highlight_check)
@@ -284,22 +449,22 @@ class ZoneEditor(QDialog):
     
     def update_zones_list(self):
         """Met à jour la liste des zones"""
+        # Les zones ou leurs noms ont pu changer
+        self._invalidate_static_layer()
+        
         # Sauvegarder l'index sélectionné
         selected_index = self.zones_list.currentRow()
         
         # Effacer la liste
         self.zones_list.clear()
         
-        # Ajouter les zones valides
-        for i, zone in enumerate(self.zones):
-            if zone is None or len(zone) < 3:
-                continue
-                
-            # Nom de la zone (par défaut "Zone X")
-            zone_name = self.zone_names.get(i, f"Zone {i+1}")
-            
-            # Ajouter à la liste
-            self.zones_list.addItem(zone_name)
+        # Ajouter les zones valides en une seule fois (nom par défaut "Zone X")
+        zone_names = self.zone_names
+        self.zones_list.addItems([
+            zone_names.get(i, f"Zone {i+1}")
+            for i, zone in enumerate(self.zones)
+            if zone is not None and len(zone) >= 3
+        ])
         
         # Restaurer la sélection si possible
         if selected_index >= 0 and selected_index < self.zones_list.count():
@@ -312,6 +477,9 @@ class ZoneEditor(QDialog):
         Args:
             index: Index de la zone dans la liste
         """
+        # La mise en valeur de la zone sélectionnée fait partie du calque statique
+        self._invalidate_static_layer()
+        
         if index < 0 or index >= len(self.zones):
             self.selected_zone_index = -1
             self.sensitivity_slider.setEnabled(False)
@@ -325,7 +493,7 @@ class ZoneEditor(QDialog):
         self.name_edit.setEnabled(True)
         
         # Définir la sensibilité
-        sensitivity = self.sensitivities.get(str(index), 50)
+        sensitivity = self.sensitivities.get(index, 50)
         self.sensitivity_slider.setValue(int(sensitivity))
         self.sensitivity_label.setText(f"{sensitivity}%")
         
@@ -336,6 +504,8 @@ class ZoneEditor(QDialog):
         """Démarre le mode dessin de zone"""
         self.is_drawing = True
         self.current_zone = []
+        self._zone_int_cache.clear()
+        self._dirty = True
         self.update_display()
     
     def edit_zone(self):
@@ -365,22 +535,30 @@ class ZoneEditor(QDialog):
                 # Supprimer la zone
                 if 0 <= self.selected_zone_index < len(self.zones):
                     del self.zones[self.selected_zone_index]
+                    self._zones_cache = None
                     
-                    # Mettre à jour les sensibilités et noms
-                    new_sensitivities = {}
-                    new_zone_names = {}
+                    # Les index des zones suivantes sont décalés
+                    self._zone_int_cache.clear()
+                    self._text_size_cache.clear()
                     
-                    for i in range(len(self.zones)):
-                        old_i = i if i < self.selected_zone_index else i + 1
-                        new_sensitivities[str(i)] = self.sensitivities.get(str(old_i), 50)
-                        if old_i in self.zone_names:
-                            new_zone_names[i] = self.zone_names[old_i]
+                    # Mettre à jour les sensibilités et noms (décalage des index suivants)
+                    removed = self.selected_zone_index
+                    old_indices = [i if i < removed else i + 1 for i in range(len(self.zones))]
                     
-                    self.sensitivities = new_sensitivities
-                    self.zone_names = new_zone_names
+                    self.sensitivities = {
+                        i: self.sensitivities.get(old_i, 50) for i, old_i in enumerate(old_indices)
+                    }
+                    self.zone_names = {
+                        i: self.zone_names[old_i] for i, old_i in enumerate(old_indices)
+                        if old_i in self.zone_names
+                    }
+                    
+                    for i in range(len(self.zones)):
+                        self._update_text_size(i)
                     
                     # Mettre à jour l'interface
                     self.selected_zone_index = -1
+                    self._invalidate_static_layer()
                     self.update_zones_list()
                     self.update_display()
                 else:
@@ -407,12 +585,14 @@ class ZoneEditor(QDialog):
             if ok and new_name:
                 # Mettre à jour le nom
                 self.zone_names[self.selected_zone_index] = new_name
+                self._update_text_size(self.selected_zone_index)
                 
                 # Mettre à jour l'interface
                 self.update_zones_list()
                 
                 # Resélectionner la zone
                 self.zones_list.setCurrentRow(self.selected_zone_index)
+                self.update_display()
         except Exception as e:
             self.logger.error(f"Erreur lors du renommage de zone: {str(e)}")
             QMessageBox.critical(self, "Erreur", f"Erreur lors du renommage: {str(e)}")
@@ -429,12 +609,13 @@ class ZoneEditor(QDialog):
         
         try:
             # Mettre à jour la sensibilité
-            self.sensitivities[str(self.selected_zone_index)] = value
+            self.sensitivities[self.selected_zone_index] = value
             
             # Mettre à jour le label
             self.sensitivity_label.setText(f"{value}%")
             
             # Mettre à jour l'affichage
+            self._invalidate_static_layer()
             self.update_display()
         except Exception as e:
             self.logger.error(f"Erreur lors de la mise à jour de la sensibilité: {str(e)}")
@@ -447,11 +628,22 @@ class ZoneEditor(QDialog):
             state: État de la case à cocher
         """
         try:
-            self.draw_grid = state == Qt.CheckState.Checked
+            self.draw_grid = self.grid_check.isChecked()
+            self._invalidate_static_layer()
             self.update_display()
         except Exception as e:
             self.logger.error(f"Erreur lors du basculement de la grille: {str(e)}")
     
+    def _on_highlight_changed(self, state: int):
+        """
+        Active/désactive la mise en valeur de la zone sélectionnée
+        
+        Args:
+            state: État de la case à cocher
+        """
+        self._invalidate_static_layer()
+        self.update_display()
+    
     def mouse_press_event(self, event: QMouseEvent):
         """
         Gère les événements de clic de souris
@@ -472,22 +664,26 @@ class ZoneEditor(QDialog):
             
             # Si c'est un clic droit avec au moins 3 points, fermer la zone
             if event.button() == Qt.MouseButton.RightButton and len(self.current_zone) >= 3:
-                # Vérifier si on est proche du premier point
-                first_point = self.current_zone[0]
-                distance = np.linalg.norm(np.array([image_x, image_y]) - np.array(first_point))
+                # Vérifier si on est proche du premier point (distance au carré, sans allocation)
+                first_x, first_y = self.current_zone[0]
+                dx = image_x - first_x
+                dy = image_y - first_y
                 
-                if distance < 20:  # Tolérance de 20 pixels
-                    # Créer un nouveau tableau numpy pour la zone
-                    zone_array = np.array(self.current_zone)
+                if dx * dx + dy * dy < 400:  # Tolérance de 20 pixels
+                    # Créer un nouveau tableau numpy int32 contigu pour la zone
+                    zone_array = np.array(self.current_zone, dtype=np.int32)
                     
                     # Vérifier que la zone est valide
                     if len(zone_array) >= 3:
                         # Ajouter la zone
                         self.zones.append(zone_array)
+                        self._zones_cache = None
                         new_index = len(self.zones) - 1
+                        self._zone_int_cache.pop(new_index, None)
+                        self._update_text_size(new_index)
                         
                         # Définir la sensibilité par défaut
-                        self.sensitivities[str(new_index)] = 50
+                        self.sensitivities[new_index] = 50
                         
                         # Mettre à jour l'interface
                         self.update_zones_list()
@@ -504,6 +700,7 @@ class ZoneEditor(QDialog):
             # Si c'est un clic gauche, ajouter un point
             if event.button() == Qt.MouseButton.LeftButton:
                 self.current_zone.append((image_x, image_y))
+                self._dirty = True
                 self.update_display()
         except Exception as e:
             self.logger.error(f"Erreur lors de l'événement de clic: {str(e)}")
@@ -528,10 +725,22 @@ class ZoneEditor(QDialog):
             
             # Mettre à jour le point de prévisualisation
             self.preview_point = (image_x, image_y)
-            self.update_display()
+            self._dirty = True
+            self._schedule_render()
         except Exception as e:
             self.logger.error(f"Erreur lors de l'événement de mouvement: {str(e)}")
     
+    def _schedule_render(self):
+        """Planifie un rafraîchissement unique pour le prochain passage de la boucle d'événements"""
+        if not self._render_pending:
+            self._render_pending = True
+            self._render_timer.start(0)
+    
+    def _on_render_timer(self):
+        """Effectue le rafraîchissement planifié"""
+        self._render_pending = False
+        self.update_display()
+    
     def mouse_release_event(self, event: QMouseEvent):
         """
         Gère les événements de relâchement de souris
@@ -554,56 +763,169 @@ class ZoneEditor(QDialog):
             Tuple (x, y) dans les coordonnées de l'image, ou (None, None) si hors limites
         """
         try:
-            if not self.image_label.pixmap() or self.image_label.pixmap().isNull():
+            # Dimensions du QLabel et du pixmap lues depuis le cache (aucun appel Qt)
+            geom = self._pixmap_geom
+            if geom is None:
                 return None, None
             
-            # Obtenir les dimensions du QLabel et de l'image
-            label_width = self.image_label.width()
-            label_height = self.image_label.height()
+            label_width, label_height, pixmap_width, pixmap_height = geom
+            image_height, image_width = self.original_frame.shape[:2]
             
-            if label_width <= 0 or label_height <= 0:
-                return None, None
-                
-            image_width = self.original_frame.shape[1]
-            image_height = self.original_frame.shape[0]
-            
-            # Récupérer les dimensions du pixmap affiché
-            pixmap = self.image_label.pixmap()
-            pixmap_width = pixmap.width()
-            pixmap_height = pixmap.height()
+            # Calcul arithmétique (compilé par numba si disponible)
+            image_x, image_y, valid = _label_to_image_coords_core(
+                label_x, label_y, label_width, label_height,
+                pixmap_width, pixmap_height, image_width, image_height
+            )
             
-            # Vérifier les dimensions du pixmap
-            if pixmap_width <= 0 or pixmap_height <= 0:
+            if valid:
+                return image_x, image_y
+            else:
                 return None, None
+        except Exception as e:
+            self.logger.error(f"Erreur lors de la conversion des coordonnées: {str(e)}")
+            return None, None
+    
+    def _update_pixmap_geometry(self):
+        """Met à jour le cache de géométrie du QLabel et du pixmap affiché"""
+        pixmap = self.image_label.pixmap()
+        if pixmap is None or pixmap.isNull():
+            self._pixmap_geom = None
+            return
+        
+        label_width = self.image_label.width()
+        label_height = self.image_label.height()
+        pixmap_width = pixmap.width()
+        pixmap_height = pixmap.height()
+        
+        if min(label_width, label_height, pixmap_width, pixmap_height) <= 0:
+            self._pixmap_geom = None
+        else:
+            self._pixmap_geom = (label_width, label_height, pixmap_width, pixmap_height)
+    
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """
+        Intercepte le redimensionnement du QLabel pour mettre à jour la géométrie en cache
+        
+        Args:
+            obj: Objet surveillé
+            event: Événement reçu
             
-            # Calculer les ratios
-            ratio_x = image_width / pixmap_width
-            ratio_y = image_height / pixmap_height
-            
-            # Calculer l'offset pour centrer l'image
-            offset_x = (label_width - pixmap_width) / 2
-            offset_y = (label_height - pixmap_height) / 2
+        Returns:
+            True si l'événement est consommé, False sinon
+        """
+        if obj is self.image_label and event.type() == QEvent.Type.Resize:
+            self._update_pixmap_geometry()
+        return super().eventFilter(obj, event)
+    
+    def _draw_vertices(self, frame: np.ndarray, points: np.ndarray, radius: int, color: Tuple[int, int, int]):
+        """
+        Dessine les sommets d'une zone sous forme de disques pleins
+        
+        Args:
+            frame: Image sur laquelle dessiner
+            points: Sommets, tableau (N, 2) int32
+            radius: Rayon des disques
+            color: Couleur BGR
+        """
+        if HAS_NUMBA and frame.ndim == 3 and frame.shape[2] == 3 and frame.dtype == np.uint8:
+            # Tous les sommets en un seul appel compilé
+            _stamp_circles(frame, np.ascontiguousarray(points), radius, np.array(color, dtype=np.uint8))
+        else:
+            for point in points.tolist():
+                cv2.circle(frame, tuple(point), radius, color, -1)
+    
+    def _update_text_size(self, index: int) -> Tuple[int, int]:
+        """
+        Calcule et met en cache les dimensions du texte du nom d'une zone
+        
+        Args:
+            index: Index de la zone
             
-            # Coordonnées relatives au pixmap
-            pixmap_x = label_x - offset_x
-            pixmap_y = label_y - offset_y
+        Returns:
+            Tuple (largeur, hauteur) du texte
+        """
+        zone_name = self.zone_names.get(index, f"Zone {index+1}")
+        text_size, _ = cv2.getTextSize(zone_name, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)
+        self._text_size_cache[index] = text_size
+        return text_size
+    
+    def _invalidate_static_layer(self):
+        """Marque le calque statique comme devant être reconstruit"""
+        self._static_dirty = True
+        self._dirty = True
+    
+    def _rebuild_static_layer(self):
+        """Reconstruit le calque statique: image originale, grille et zones validées"""
+        static_frame = self._static_layer
+        np.copyto(static_frame, self.original_frame)
+        
+        # Dessiner la grille si activée (lignes d'un pixel tous les 50 pixels, gris clair)
+        if self.draw_grid:
+            static_frame[::_GRID_SPACING, :] = _GRID_COLOR
+            static_frame[:, ::_GRID_SPACING] = _GRID_COLOR
+        
+        # Dessiner les zones existantes
+        for i, zone in enumerate(self.zones):
+            if not isinstance(zone, np.ndarray) or zone.size == 0 or len(zone) < 3:
+                continue
             
-            # Si les coordonnées sont hors du pixmap, retourner None
-            if pixmap_x < 0 or pixmap_x >= pixmap_width or pixmap_y < 0 or pixmap_y >= pixmap_height:
-                return None, None
+            # Déterminer la couleur selon la sensibilité et si la zone est sélectionnée
+            is_selected = (i == self.selected_zone_index)
             
-            # Convertir en coordonnées d'image
-            image_x = int(pixmap_x * ratio_x)
-            image_y = int(pixmap_y * ratio_y)
+            # Sensibilité de 0 à 100
+            sensitivity = int(self.sensitivities.get(i, 50))
             
-            # Vérifier les limites dans l'image
-            if 0 <= image_x < image_width and 0 <= image_y < image_height:
-                return image_x, image_y
+            # Couleur de base: plus la sensibilité est élevée, plus la zone est verte
+            # Vert pour les zones normales, bleu pour la zone sélectionnée
+            if is_selected and self.highlight_check.isChecked():
+                # Bleu pour la zone sélectionnée
+                color = (255, 0, 0)  # BGR
+                thickness = 3
             else:
-                return None, None
-        except Exception as e:
-            self.logger.error(f"Erreur lors de la conversion des coordonnées: {str(e)}")
-            return None, None
+                # Vert avec intensité basée sur la sensibilité
+                green_intensity = int(100 + (sensitivity / 100) * 155)  # 100 à 255
+                color = (0, green_intensity, 0)  # BGR
+                thickness = 2
+            
+            # Vérifier que la zone a le bon format
+            try:
+                # Dessiner le polygone (conversion int32 mise en cache par zone)
+                zone_points = self._zone_int_cache.get(i)
+                if zone_points is None:
+                    zone_points = self._zone_int_cache[i] = zone.reshape((-1, 1, 2)).astype(np.int32)
+                cv2.polylines(static_frame, [zone_points], True, color, thickness)
+                
+                # Dessiner les sommets
+                self._draw_vertices(static_frame, zone_points.reshape(-1, 2), 4, color)
+                
+                # Afficher le numéro et le nom de la zone
+                if len(zone) > 0:
+                    # Centre calculé en une seule passe sur les deux axes
+                    center_x, center_y = zone.mean(axis=0).astype(np.int32).tolist()
+                    
+                    # Obtenir le nom de la zone
+                    zone_name = self.zone_names.get(i, f"Zone {i+1}")
+                    
+                    # Vérifier que le centre est dans l'image
+                    h, w = static_frame.shape[:2]
+                    if 0 <= center_x < w and 0 <= center_y < h:
+                        # Dessiner un fond pour le texte (dimensions calculées au nommage)
+                        text_size = self._text_size_cache.get(i)
+                        if text_size is None:
+                            text_size = self._update_text_size(i)
+                        cv2.rectangle(static_frame, 
+                                    (center_x - 5, center_y - text_size[1] - 5), 
+                                    (center_x + text_size[0] + 5, center_y + 5), 
+                                    (0, 0, 0), -1)
+                        
+                        # Dessiner le texte
+                        cv2.putText(static_frame, zone_name, (center_x, center_y),
+                                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            except Exception as zone_error:
+                self.logger.error(f"Erreur lors du dessin de la zone {i}: {str(zone_error)}")
+                continue
+        
+        self._static_dirty = False
     
     def update_display(self):
         """Met à jour l'affichage de l'image avec les zones"""
@@ -611,97 +933,52 @@ class ZoneEditor(QDialog):
             if self.original_frame is None:
                 return
             
-            # Copier l'image originale
-            display_frame = self.original_frame.copy()
+            # Rien n'a changé depuis le dernier rendu: éviter la conversion en QPixmap
+            if not self._dirty and not self.is_drawing:
+                return
             
-            # Dessiner la grille si activée
-            if self.draw_grid:
-                self._draw_grid(display_frame)
+            # Une conversion est déjà en cours: le rendu sera relancé à sa réception
+            if self._conversion_pending:
+                self._conversion_requeued = True
+                return
             
-            # Dessiner les zones existantes
-            for i, zone in enumerate(self.zones):
-                if not isinstance(zone, np.ndarray) or zone.size == 0 or len(zone) < 3:
-                    continue
-                
-                # Déterminer la couleur selon la sensibilité et si la zone est sélectionnée
-                is_selected = (i == self.selected_zone_index)
-                
-                # Sensibilité de 0 à 100
-                sensitivity = int(self.sensitivities.get(str(i), 50))
-                
-                # Couleur de base: plus la sensibilité est élevée, plus la zone est verte
-                # Vert pour les zones normales, bleu pour la zone sélectionnée
-                if is_selected and self.highlight_check.isChecked():
-                    # Bleu pour la zone sélectionnée
-                    color = (255, 0, 0)  # BGR
-                    thickness = 3
-                else:
-                    # Vert avec intensité basée sur la sensibilité
-                    green_intensity = int(100 + (sensitivity / 100) * 155)  # 100 à 255
-                    color = (0, green_intensity, 0)  # BGR
-                    thickness = 2
-                
-                # Vérifier que la zone a le bon format
-                try:
-                    # Dessiner le polygone
-                    zone_points = zone.reshape((-1, 1, 2)).astype(np.int32)
-                    cv2.polylines(display_frame, [zone_points], True, color, thickness)
-                    
-                    # Dessiner les sommets
-                    for point in zone:
-                        cv2.circle(display_frame, (int(point[0]), int(point[1])), 4, color, -1)
-                    
-                    # Afficher le numéro et le nom de la zone
-                    if len(zone) > 0:
-                        center_x = int(np.mean(zone[:, 0]))
-                        center_y = int(np.mean(zone[:, 1]))
-                        
-                        # Obtenir le nom de la zone
-                        zone_name = self.zone_names.get(i, f"Zone {i+1}")
-                        
-                        # Vérifier que le centre est dans l'image
-                        h, w = display_frame.shape[:2]
-                        if 0 <= center_x < w and 0 <= center_y < h:
-                            # Dessiner un fond pour le texte
-                            text_size, _ = cv2.getTextSize(zone_name, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)
-                            cv2.rectangle(display_frame, 
-                                        (center_x - 5, center_y - text_size[1] - 5), 
-                                        (center_x + text_size[0] + 5, center_y + 5), 
-                                        (0, 0, 0), -1)
-                            
-                            # Dessiner le texte
-                            cv2.putText(display_frame, zone_name, (center_x, center_y),
-                                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-                except Exception as zone_error:
-                    self.logger.error(f"Erreur lors du dessin de la zone {i}: {str(zone_error)}")
-                    continue
+            # Reconstruire le calque statique uniquement si les zones, la sélection ou la grille ont changé
+            if self._static_dirty:
+                self._rebuild_static_layer()
+            
+            # Partir du calque statique, copié dans le tampon non utilisé par la conversion en cours
+            buffer_index = 1 - self._display_index
+            display_frame = self._display_bufs[buffer_index]
+            np.copyto(display_frame, self._static_layer)
             
             # Dessiner la zone en cours
             if self.is_drawing and len(self.current_zone) > 0:
                 try:
-                    # Dessiner les lignes entre les points
-                    for i in range(len(self.current_zone) - 1):
-                        pt1 = tuple(map(int, self.current_zone[i]))
-                        pt2 = tuple(map(int, self.current_zone[i+1]))
-                        cv2.line(display_frame, pt1, pt2, (255, 0, 0), 2)
+                    # Convertir une seule fois les points de la zone en cours en entiers
+                    current_array = np.asarray(self.current_zone, dtype=np.int32)
+                    current_points = current_array.tolist()
                     
-                    # Dessiner les points individuels
-                    for i, point in enumerate(self.current_zone):
-                        pt = tuple(map(int, point))
+                    # Dessiner les lignes entre les points en un seul appel
+                    cv2.polylines(display_frame, [current_array.reshape((-1, 1, 2))], False, (255, 0, 0), 2)
+                    
+                    # Dessiner les points individuels (seuls les sommets de la zone en cours
+                    # sont dessinés à chaque image, ceux des zones validées sont dans le calque statique)
+                    for i, point in enumerate(current_points):
+                        pt = tuple(point)
                         color = (0, 255, 0) if i == 0 else (255, 0, 0)  # Premier point en vert
                         cv2.circle(display_frame, pt, 5, color, -1)
                         cv2.putText(display_frame, str(i+1), (pt[0] + 5, pt[1] - 5),
                                     cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
                     
                     # Dessiner la ligne de prévisualisation
-                    if self.preview_point and len(self.current_zone) > 0:
-                        last_pt = tuple(map(int, self.current_zone[-1]))
+                    if self.preview_point and len(current_points) > 0:
+                        last_pt = tuple(current_points[-1])
                         preview_pt = tuple(map(int, self.preview_point))
                         cv2.line(display_frame, last_pt, preview_pt, (200, 200, 200), 1)
                         
                         # Si plus de 2 points, montrer une ligne vers le premier point
-                        if len(self.current_zone) > 2:
-                            first_pt = tuple(map(int, self.current_zone[0]))
+                        if len(current_points) > 2:
+                            first_pt = tuple(current_points[0])
                             cv2.line(display_frame, preview_pt, first_pt, (200, 200, 200), 1, cv2.LINE_AA)
                     
                     # Instructions pour fermer la zone
@@ -721,90 +998,97 @@ class ZoneEditor(QDialog):
                 except Exception as current_error:
                     self.logger.error(f"Erreur lors du dessin de la zone en cours: {str(current_error)}")
             
-            # Sauvegarder la frame modifiée
-            self.display_frame = display_frame.copy()
-            
             # Afficher l'image
-            self._display_frame(display_frame)
+            self._display_frame(display_frame, buffer_index)
+            self._dirty = False
         except Exception as e:
             self.logger.error(f"Erreur lors de la mise à jour de l'affichage: {str(e)}")
     
-    def _draw_grid(self, frame: np.ndarray):
+    @property
+    def display_frame(self) -> np.ndarray:
+        """Dernière frame affichée (copie à la demande du tampon d'affichage)"""
+        return self._display_bufs[self._display_index].copy()
+    
+    def _display_frame(self, frame: np.ndarray, buffer_index: int):
         """
-        Dessine une grille sur l'image
+        Envoie la frame au thread de conversion pour affichage dans le QLabel
         
         Args:
-            frame: Image sur laquelle dessiner
+            frame: Frame à afficher
+            buffer_index: Index du tampon d'affichage contenant la frame
         """
         try:
             if frame is None or frame.size == 0:
                 return
-                
-            height, width = frame.shape[:2]
             
-            # Espacement de la grille
-            grid_spacing = 50
-            
-            # Couleur et épaisseur
-            color = (200, 200, 200)  # Gris clair
-            thickness = 1
-            
-            # Dessiner les lignes verticales
-            for x in range(0, width, grid_spacing):
-                cv2.line(frame, (x, 0), (x, height), color, thickness)
-            
-            # Dessiner les lignes horizontales
-            for y in range(0, height, grid_spacing):
-                cv2.line(frame, (0, y), (width, y), color, thickness)
+            self._conversion_pending = True
+            self._convert_requested.emit(buffer_index, frame)
         except Exception as e:
-            self.logger.error(f"Erreur lors du dessin de la grille: {str(e)}")
+            self._conversion_pending = False
+            self.logger.error(f"Erreur lors de l'affichage de la frame: {str(e)}")
     
-    def _display_frame(self, frame: np.ndarray):
+    @pyqtSlot(int, QImage)
+    def _on_image_ready(self, buffer_index: int, qt_image: QImage):
         """
-        Affiche la frame dans le QLabel
+        Affiche l'image convertie par le thread de conversion
         
         Args:
-            frame: Frame à afficher
+            buffer_index: Index du tampon d'affichage converti
+            qt_image: Image convertie
         """
+        self._conversion_pending = False
+        
         try:
-            if frame is None or frame.size == 0:
-                return
-            
-            # Convertir en RGB pour Qt
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_frame.shape
-            
-            # Convertir en QImage
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-            
-            # Mettre à jour le QLabel
-            self.image_label.setPixmap(QPixmap.fromImage(qt_image))
+            if qt_image.isNull():
+                self.logger.error("Erreur lors de la conversion de la frame")
+            else:
+                # Mettre à jour le QLabel
+                self._display_index = buffer_index
+                self.image_label.setPixmap(QPixmap.fromImage(qt_image))
+                self._update_pixmap_geometry()
         except Exception as e:
             self.logger.error(f"Erreur lors de l'affichage de la frame: {str(e)}")
+        
+        # Un rafraîchissement a été demandé pendant la conversion
+        if self._conversion_requeued:
+            self._conversion_requeued = False
+            self._schedule_render()
     
-    def get_zones(self) -> List[np.ndarray]:
+    def done(self, result: int):
+        """
+        Ferme le dialogue et arrête le thread de conversion
+        
+        Args:
+            result: Code de retour du dialogue
+        """
+        self._render_timer.stop()
+        self._converter_thread.quit()
+        self._converter_thread.wait()
+        super().done(result)
+    
+    def get_zones(self) -> Tuple[np.ndarray, ...]:
         """
         Retourne les zones définies
         
         Returns:
-            Liste des zones
+            Tuple des zones (tableaux int32 contigus), identique tant que les zones ne changent pas
         """
-        # Ne retourner que les zones valides
-        valid_zones = []
-        for zone in self.zones:
-            if isinstance(zone, np.ndarray) and zone.size >= 6:  # Au moins 3 points (x,y)
-                valid_zones.append(zone)
-        return valid_zones
+        # Ne retourner que les zones valides (recalculées uniquement après un ajout ou une suppression)
+        if self._zones_cache is None:
+            self._zones_cache = tuple(
+                zone for zone in self.zones
+                if isinstance(zone, np.ndarray) and zone.size >= 6  # Au moins 3 points (x,y)
+            )
+        return self._zones_cache
     
     def get_sensitivities(self) -> Dict[str, float]:
         """
         Retourne les sensibilités des zones
         
         Returns:
-            Dictionnaire des sensibilités
+            Dictionnaire des sensibilités (clés sous forme de chaînes, comme dans la configuration)
         """
-        return self.sensitivities
+        return {str(i): value for i, value in self.sensitivities.items()}
     
     def get_zone_names(self) -> Dict[int, str]:
         """
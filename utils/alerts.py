@@ -7,14 +7,24 @@ Gère l'envoi de notifications par email, webhook et système.
 """
 import sys  # Ajout pour les références à sys.platform
 import os
+import mmap
+import base64
+import mimetypes
 import smtplib
+import subprocess
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
-from email.mime.image import MIMEImage
+from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
+from types import SimpleNamespace
+from urllib.parse import urlparse
 from typing import Dict, List, Any, Optional, Union, Tuple
 
 # Importation conditionnelle des bibliothèques de notification système
@@ -39,8 +49,76 @@ try:
 except ImportError:
     HAS_PYNC = False
 
+# Import conditionnel d'orjson pour sérialiser les payloads de webhook
+try:
+    import orjson
+    
+    def _dumps_payload(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _dumps_payload(data: Any) -> bytes:
+        return json.dumps(data).encode('utf-8')
+
 from utils.logger import get_module_logger
 
+# win10toast (utilisé seulement si notify2 est absent) est déjà asynchrone avec threaded=True
+_NOTIFICATION_IS_ASYNC = HAS_WIN10TOAST and not HAS_NOTIFY2
+
+# Gabarit HTML des alertes email
+_EMAIL_HTML_TEMPLATE = """
+<html>
+<body>
+<h2>Alerte de détection</h2>
+<p>Une détection a été enregistrée le {timestamp}</p>
+<p><strong>Détails:</strong></p>
+<ul>
+{details}
+</ul>
+<p>Cette alerte a été envoyée automatiquement par DETECTCAM.</p>
+</body>
+</html>
+"""
+
+# Délais (connexion, lecture) des requêtes HTTP des webhooks, en secondes
+_HTTP_TIMEOUT = (3, 10)
+
+# En-têtes des requêtes de webhook (payload JSON déjà sérialisé)
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+def _format_timestamps(now: Optional[datetime] = None) -> Tuple[str, str]:
+    """
+    Formate l'horodatage d'une alerte
+    
+    Args:
+        now: Date de l'alerte (maintenant par défaut)
+        
+    Returns:
+        Tuple (horodatage ISO, horodatage lisible)
+    """
+    if now is None:
+        now = datetime.now()
+    return now.isoformat(), now.strftime('%Y-%m-%d à %H:%M:%S')
+
+
+def _resolve_webhook_kind(webhook_url: str) -> str:
+    """
+    Détermine le type de webhook à partir de son URL
+    
+    Args:
+        webhook_url: URL du webhook
+        
+    Returns:
+        'discord', 'slack' ou 'generic'
+    """
+    host = (urlparse(webhook_url).hostname or '').lower()
+    
+    if host == 'discord.com' or host.endswith('.discord.com'):
+        return 'discord'
+    if host == 'hooks.slack.com':
+        return 'slack'
+    return 'generic'
+
+
 class AlertManager:
     """
     Gestionnaire d'alertes pour les détections
@@ -55,19 +133,73 @@ class AlertManager:
         """
         self.logger = get_module_logger('AlertManager')
         
-        # Configuration
-        self.config = config
-        self.alert_config = config.get('alerts', {})
-        
         # État interne
         self.detection_counter = 0
-        self.alert_threshold = self.alert_config.get('alert_threshold', 5)
+        
+        # Configuration (indicateurs et limiteur de débit figés à chaque chargement)
+        self.reload_config(config)
+        self._bucket_tokens = self._bucket_capacity
+        self._last_refill = time.monotonic()
+        
+        # Pool de threads réutilisé pour l'envoi des alertes (évite un thread par alerte)
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='alert')
+        
+        # Session HTTP persistante: les webhooks successifs réutilisent la connexion TLS
+        self._http = requests.Session()
+        # Nouvelles tentatives avec attente exponentielle en cas d'échec du serveur distant
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['POST'])
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
+        
+        # Dernière pièce jointe encodée en base64: ((chemin, mtime, taille), sous-type, contenu)
+        self._attachment_cache: Optional[Tuple[Tuple[str, int, int], str, str]] = None
+        
+        # Connexion SMTP persistante, réutilisée entre les alertes email (protégée par un verrou)
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_key: Optional[Tuple[str, int, str]] = None
+        self._smtp_lock = threading.Lock()
+        
+        # Processus de lecture du son d'alerte en cours (posix)
+        self._sound_proc: Optional[subprocess.Popen] = None
         
         # Initialiser les notifications système si disponibles
         self._init_system_notifications()
         
         self.logger.info("Gestionnaire d'alertes initialisé")
     
+    def reload_config(self, config: Dict[str, Any]):
+        """
+        Charge la configuration des alertes et met en cache les indicateurs d'activation
+        
+        Args:
+            config: Configuration de l'application
+        """
+        self.config = config
+        self.alert_config = config.get('alerts', {})
+        self.alert_threshold = self.alert_config.get('alert_threshold', 5)
+        
+        # Indicateurs lus une seule fois plutôt qu'à chaque alerte
+        self._flags = SimpleNamespace(
+            email=bool(self.alert_config.get('email_enabled', False)),
+            notification=bool(self.alert_config.get('notification_enabled', True)),
+            webhook=bool(self.alert_config.get('webhook_enabled', False)),
+            sound=bool(self.alert_config.get('sound_alert', False))
+        )
+        
+        # Type de webhook déterminé une seule fois à partir de l'URL
+        self._webhook_url = self.alert_config.get('webhook_url', '')
+        self._webhook_kind = _resolve_webhook_kind(self._webhook_url)
+        
+        # Limiteur à seau de jetons: lisse les rafales d'alertes lorsque les détections s'enchaînent
+        self._bucket_rate = max(0.0, float(self.alert_config.get('alert_rate_per_minute', 6))) / 60.0
+        self._bucket_capacity = max(1.0, float(self.alert_config.get('alert_burst', 3)))
+    
     def _init_system_notifications(self):
         """Initialise les notifications système selon la plateforme"""
         try:
@@ -89,7 +221,7 @@ class AlertManager:
                 self.logger.warning("Aucune bibliothèque de notification système disponible")
                 
         except Exception as e:
-            self.logger.error(f"Erreur lors de l'initialisation des notifications système: {str(e)}")
+            self.logger.error("Erreur lors de l'initialisation des notifications système: %s", e)
     
     def process_detection(self, detection_info: Dict[str, Any], 
                         image_path: Optional[str] = None) -> bool:
@@ -108,15 +240,39 @@ class AlertManager:
         
         # Vérifier si le seuil est atteint
         if self.detection_counter >= self.alert_threshold:
-            # Déclencher les alertes
-            self.trigger_alerts(detection_info, image_path)
-            
             # Réinitialiser le compteur
             self.detection_counter = 0
+            
+            # Limiter le débit des alertes (seau de jetons)
+            if not self._consume_token():
+                self.logger.debug("Alerte ignorée: limite de débit atteinte")
+                return False
+            
+            # Déclencher les alertes
+            self.trigger_alerts(detection_info, image_path)
             return True
         
         return False
     
+    def _consume_token(self) -> bool:
+        """
+        Recharge le seau de jetons et en consomme un si possible
+        
+        Returns:
+            True si un jeton était disponible, False sinon
+        """
+        now = time.monotonic()
+        self._bucket_tokens = min(
+            self._bucket_capacity,
+            self._bucket_tokens + (now - self._last_refill) * self._bucket_rate
+        )
+        self._last_refill = now
+        
+        if self._bucket_tokens >= 1.0:
+            self._bucket_tokens -= 1.0
+            return True
+        return False
+    
     def reset_counter(self):
         """Réinitialise le compteur de détection"""
         self.detection_counter = 0
@@ -133,57 +289,49 @@ class AlertManager:
             force: Forcer le déclenchement même si désactivé
         """
         self.logger.info("Déclenchement des alertes")
+        flags = self._flags
         
-        # Créer un thread pour chaque type d'alerte
-        threads = []
+        # Horodatage calculé une seule fois pour toutes les alertes de l'événement
+        timestamps = _format_timestamps()
         
+        # Soumettre chaque type d'alerte au pool de threads
         # Email
-        if self.alert_config.get('email_enabled', False) or force:
-            email_thread = threading.Thread(
-                target=self._send_email_alert,
-                args=(detection_info, image_path)
-            )
-            email_thread.daemon = True
-            threads.append(email_thread)
+        if flags.email or force:
+            self._executor.submit(self._send_email_alert, detection_info, image_path, timestamps)
         
         # Notification système
-        if self.alert_config.get('notification_enabled', True) or force:
-            notification_thread = threading.Thread(
-                target=self._send_system_notification,
-                args=(detection_info,)
-            )
-            notification_thread.daemon = True
-            threads.append(notification_thread)
+        if flags.notification or force:
+            if _NOTIFICATION_IS_ASYNC:
+                # win10toast affiche déjà la notification dans son propre thread
+                self._send_system_notification(detection_info)
+            else:
+                self._executor.submit(self._send_system_notification, detection_info)
         
         # Webhook
-        if self.alert_config.get('webhook_enabled', False) or force:
-            webhook_thread = threading.Thread(
-                target=self._send_webhook,
-                args=(detection_info, image_path)
-            )
-            webhook_thread.daemon = True
-            threads.append(webhook_thread)
+        if flags.webhook or force:
+            self._executor.submit(self._send_webhook, detection_info, image_path, timestamps)
         
         # Son d'alerte
-        if self.alert_config.get('sound_alert', False) or force:
-            sound_thread = threading.Thread(
-                target=self._play_alert_sound
-            )
-            sound_thread.daemon = True
-            threads.append(sound_thread)
-        
-        # Démarrer tous les threads
-        for thread in threads:
-            thread.start()
+        if flags.sound or force:
+            self._executor.submit(self._play_alert_sound)
+    
+    def close(self):
+        """Arrête le pool de threads d'envoi des alertes et ferme les connexions HTTP et SMTP"""
+        self._executor.shutdown(wait=False)
+        self._http.close()
+        with self._smtp_lock:
+            self._close_smtp()
     
     def _send_email_alert(self, detection_info: Dict[str, Any], 
-                        image_path: Optional[str] = None):
+                        image_path: Optional[str] = None,
+                        timestamps: Optional[Tuple[str, str]] = None):
         """
         Envoie une alerte par email
         
         Args:
             detection_info: Informations sur la détection
             image_path: Chemin de l'image de détection
+            timestamps: Horodatages (ISO, lisible) de l'alerte, calculés si absents
         """
         try:
             # Récupérer les paramètres
@@ -204,56 +352,149 @@ class AlertManager:
             msg['From'] = username
             msg['To'] = recipient
             
-            # Créer le contenu HTML
-            html = f"""
-            <html>
-            <body>
-            <h2>Alerte de détection</h2>
-            <p>Une détection a été enregistrée le {datetime.now().strftime('%Y-%m-%d à %H:%M:%S')}</p>
-            <p><strong>Détails:</strong></p>
-            <ul>
-            """
-            
-            # Ajouter les détails de la détection
+            # Détails de la détection
+            rows = []
             if 'class_name' in detection_info:
-                html += f"<li>Objet: {detection_info['class_name']}</li>"
+                rows.append(f"<li>Objet: {detection_info['class_name']}</li>")
             if 'zone' in detection_info:
-                zone_name = f"Zone {detection_info['zone']}"
-                html += f"<li>Zone: {zone_name}</li>"
+                rows.append(f"<li>Zone: Zone {detection_info['zone']}</li>")
             if 'confidence' in detection_info:
                 confidence = detection_info['confidence']
                 if isinstance(confidence, (int, float)):
-                    html += f"<li>Confiance: {confidence:.2f}</li>"
+                    rows.append(f"<li>Confiance: {confidence:.2f}</li>")
                 else:
-                    html += f"<li>Confiance: {confidence}</li>"
+                    rows.append(f"<li>Confiance: {confidence}</li>")
             
-            html += """
-            </ul>
-            <p>Cette alerte a été envoyée automatiquement par DETECTCAM.</p>
-            </body>
-            </html>
-            """
+            # Créer le contenu HTML
+            html = _EMAIL_HTML_TEMPLATE.format(
+                timestamp=(timestamps or _format_timestamps())[1],
+                details="\n".join(rows)
+            )
             
             # Ajouter le contenu HTML
             msg.attach(MIMEText(html, 'html'))
             
             # Ajouter l'image si disponible
-            if image_path and os.path.exists(image_path):
-                with open(image_path, 'rb') as img_file:
-                    img = MIMEImage(img_file.read())
-                    img.add_header('Content-Disposition', 'attachment', filename=os.path.basename(image_path))
+            if image_path:
+                img = self._build_image_attachment(image_path)
+                if img is not None:
                     msg.attach(img)
             
-            # Connexion au serveur SMTP et envoi
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                server.login(username, password)
-                server.send_message(msg)
+            # Envoi via la connexion SMTP persistante
+            with self._smtp_lock:
+                server = self._get_smtp_connection(smtp_server, smtp_port, username, password)
+                try:
+                    server.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # Connexion fermée par le serveur entre-temps: reconnecter une fois
+                    self._close_smtp()
+                    server = self._get_smtp_connection(smtp_server, smtp_port, username, password)
+                    server.send_message(msg)
             
-            self.logger.info(f"Alerte email envoyée à {recipient}")
+            self.logger.info("Alerte email envoyée à %s", recipient)
             
         except Exception as e:
-            self.logger.error(f"Erreur lors de l'envoi de l'alerte email: {str(e)}")
+            self.logger.error("Erreur lors de l'envoi de l'alerte email: %s", e)
+    
+    def _get_smtp_connection(self, smtp_server: str, smtp_port: int,
+                             username: str, password: str) -> smtplib.SMTP:
+        """
+        Retourne la connexion SMTP persistante, en la rétablissant si nécessaire
+        
+        Doit être appelée avec self._smtp_lock acquis.
+        
+        Args:
+            smtp_server: Serveur SMTP
+            smtp_port: Port SMTP
+            username: Identifiant de connexion
+            password: Mot de passe
+            
+        Returns:
+            Connexion SMTP authentifiée
+        """
+        key = (smtp_server, smtp_port, username)
+        
+        # Réutiliser la connexion existante si elle répond encore
+        if self._smtp is not None and self._smtp_key == key:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+        
+        self._close_smtp()
+        
+        server = smtplib.SMTP(smtp_server, smtp_port)
+        try:
+            server.starttls()
+            server.login(username, password)
+        except Exception:
+            server.close()
+            raise
+        
+        self._smtp = server
+        self._smtp_key = key
+        return server
+    
+    def _close_smtp(self):
+        """Ferme la connexion SMTP persistante (avec self._smtp_lock acquis)"""
+        if self._smtp is None:
+            return
+        
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        
+        self._smtp = None
+        self._smtp_key = None
+    
+    def _build_image_attachment(self, image_path: str) -> Optional[MIMEBase]:
+        """
+        Construit la pièce jointe image d'un email
+        
+        Le fichier est encodé en base64 directement depuis une vue mmap, et le résultat
+        est mis en cache tant que le fichier n'est pas modifié.
+        
+        Args:
+            image_path: Chemin de l'image
+            
+        Returns:
+            Pièce jointe MIME, ou None si l'image est absente ou vide
+        """
+        # Un seul stat sert à la fois de test d'existence et de clé de cache
+        try:
+            stat = os.stat(image_path)
+        except FileNotFoundError:
+            return None
+        
+        if stat.st_size == 0:
+            return None
+        
+        key = (image_path, stat.st_mtime_ns, stat.st_size)
+        cached = self._attachment_cache
+        
+        if cached is not None and cached[0] == key:
+            _, subtype, encoded = cached
+        else:
+            mime_type, _ = mimetypes.guess_type(image_path)
+            subtype = mime_type.split('/', 1)[1] if mime_type and mime_type.startswith('image/') else 'jpeg'
+            
+            try:
+                with open(image_path, 'rb') as img_file, \
+                        mmap.mmap(img_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    encoded = base64.encodebytes(mapped).decode('ascii')
+            except (FileNotFoundError, ValueError):
+                # Fichier supprimé ou vidé entre le stat et l'ouverture
+                return None
+            
+            self._attachment_cache = (key, subtype, encoded)
+        
+        img = MIMEBase('image', subtype)
+        img.set_payload(encoded)
+        img['Content-Transfer-Encoding'] = 'base64'
+        img.add_header('Content-Disposition', 'attachment', filename=os.path.basename(image_path))
+        return img
     
     def _send_system_notification(self, detection_info: Dict[str, Any]):
         """
@@ -307,59 +548,73 @@ class AlertManager:
                 self.logger.warning("Aucune bibliothèque de notification système disponible")
                 
         except Exception as e:
-            self.logger.error(f"Erreur lors de l'envoi de la notification système: {str(e)}")
+            self.logger.error("Erreur lors de l'envoi de la notification système: %s", e)
     
     def _send_webhook(self, detection_info: Dict[str, Any], 
-                    image_path: Optional[str] = None):
+                    image_path: Optional[str] = None,
+                    timestamps: Optional[Tuple[str, str]] = None):
         """
         Envoie une alerte via webhook
         
         Args:
             detection_info: Informations sur la détection
             image_path: Chemin de l'image de détection
+            timestamps: Horodatages (ISO, lisible) de l'alerte, calculés si absents
+        """
+        webhook_url = self._webhook_url
+        
+        if not webhook_url:
+            self.logger.error("URL de webhook non définie")
+            return
+        
+        if timestamps is None:
+            timestamps = _format_timestamps()
+        
+        # Intégration Discord, Slack ou webhook générique selon l'URL configurée
+        sender = getattr(self, f'_send_{self._webhook_kind}_webhook')
+        sender(webhook_url, detection_info, image_path, timestamps)
+    
+    def _send_generic_webhook(self, webhook_url: str, 
+                            detection_info: Dict[str, Any], 
+                            image_path: Optional[str] = None,
+                            timestamps: Optional[Tuple[str, str]] = None):
+        """
+        Envoie une alerte via un webhook générique (JSON)
+        
+        Args:
+            webhook_url: URL du webhook
+            detection_info: Informations sur la détection
+            image_path: Chemin de l'image de détection
+            timestamps: Horodatages (ISO, lisible) de l'alerte, calculés si absents
         """
         try:
-            webhook_url = self.alert_config.get('webhook_url', '')
-            
-            if not webhook_url:
-                self.logger.error("URL de webhook non définie")
-                return
-            
             # Créer les données à envoyer
             webhook_data = {
                 'event_type': 'detection',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': (timestamps or _format_timestamps())[0],
                 'detection': detection_info
             }
             
-            # Pour une intégration Discord
-            if 'discord.com' in webhook_url:
-                self._send_discord_webhook(webhook_url, detection_info, image_path)
-                return
-            
-            # Pour une intégration Slack
-            if 'hooks.slack.com' in webhook_url:
-                self._send_slack_webhook(webhook_url, detection_info, image_path)
-                return
-            
             # Webhook générique (JSON)
-            response = requests.post(
+            response = self._http.post(
                 webhook_url,
-                json=webhook_data,
-                headers={'Content-Type': 'application/json'}
+                data=_dumps_payload(webhook_data),
+                headers=_JSON_HEADERS,
+                timeout=_HTTP_TIMEOUT
             )
             
             if response.status_code < 200 or response.status_code >= 300:
-                self.logger.error(f"Erreur de webhook: {response.status_code} {response.text}")
+                self.logger.error("Erreur de webhook: %s %s", response.status_code, response.text)
             else:
-                self.logger.info(f"Webhook envoyé: {response.status_code}")
+                self.logger.info("Webhook envoyé: %s", response.status_code)
                 
         except Exception as e:
-            self.logger.error(f"Erreur lors de l'envoi du webhook: {str(e)}")
+            self.logger.error("Erreur lors de l'envoi du webhook: %s", e)
     
     def _send_discord_webhook(self, webhook_url: str, 
                             detection_info: Dict[str, Any], 
-                            image_path: Optional[str] = None):
+                            image_path: Optional[str] = None,
+                            timestamps: Optional[Tuple[str, str]] = None):
         """
         Envoie une alerte via un webhook Discord
         
@@ -367,25 +622,27 @@ class AlertManager:
             webhook_url: URL du webhook Discord
             detection_info: Informations sur la détection
             image_path: Chemin de l'image de détection
+            timestamps: Horodatages (ISO, lisible) de l'alerte, calculés si absents
         """
         try:
             # Créer l'embed Discord
-            timestamp = datetime.now().isoformat()
+            timestamp = (timestamps or _format_timestamps())[0]
             
             # Créer la description
-            description = "Une détection a été enregistrée.\n\n"
+            lines = ["Une détection a été enregistrée.\n"]
             
             if 'class_name' in detection_info:
-                description += f"**Objet**: {detection_info['class_name']}\n"
+                lines.append(f"**Objet**: {detection_info['class_name']}")
             if 'zone' in detection_info:
-                zone_name = f"Zone {detection_info['zone']}"
-                description += f"**Zone**: {zone_name}\n"
+                lines.append(f"**Zone**: Zone {detection_info['zone']}")
             if 'confidence' in detection_info:
                 confidence = detection_info['confidence']
                 if isinstance(confidence, (int, float)):
-                    description += f"**Confiance**: {confidence:.2f}\n"
+                    lines.append(f"**Confiance**: {confidence:.2f}")
                 else:
-                    description += f"**Confiance**: {confidence}\n"
+                    lines.append(f"**Confiance**: {confidence}")
+            
+            description = "\n".join(lines) + "\n"
             
             # Créer l'embed
             embed = {
@@ -410,22 +667,25 @@ class AlertManager:
             }
             
             # Envoyer le webhook
-            response = requests.post(
+            response = self._http.post(
                 webhook_url,
-                json=payload
+                data=_dumps_payload(payload),
+                headers=_JSON_HEADERS,
+                timeout=_HTTP_TIMEOUT
             )
             
             if response.status_code < 200 or response.status_code >= 300:
-                self.logger.error(f"Erreur de webhook Discord: {response.status_code} {response.text}")
+                self.logger.error("Erreur de webhook Discord: %s %s", response.status_code, response.text)
             else:
                 self.logger.info("Webhook Discord envoyé")
                 
         except Exception as e:
-            self.logger.error(f"Erreur lors de l'envoi du webhook Discord: {str(e)}")
+            self.logger.error("Erreur lors de l'envoi du webhook Discord: %s", e)
     
     def _send_slack_webhook(self, webhook_url: str, 
                           detection_info: Dict[str, Any], 
-                          image_path: Optional[str] = None):
+                          image_path: Optional[str] = None,
+                          timestamps: Optional[Tuple[str, str]] = None):
         """
         Envoie une alerte via un webhook Slack
         
@@ -433,8 +693,11 @@ class AlertManager:
             webhook_url: URL du webhook Slack
             detection_info: Informations sur la détection
             image_path: Chemin de l'image de détection
+            timestamps: Horodatages (ISO, lisible) de l'alerte, calculés si absents
         """
         try:
+            human_time = (timestamps or _format_timestamps())[1]
+            
             # Créer le texte
             text = "DETECTCAM - Alerte de détection"
             
@@ -451,7 +714,7 @@ class AlertManager:
                     'type': 'section',
                     'text': {
                         'type': 'mrkdwn',
-                        'text': f"Une détection a été enregistrée le {datetime.now().strftime('%Y-%m-%d à %H:%M:%S')}"
+                        'text': f"Une détection a été enregistrée le {human_time}"
                     }
                 }
             ]
@@ -510,18 +773,20 @@ class AlertManager:
             }
             
             # Envoyer le webhook
-            response = requests.post(
+            response = self._http.post(
                 webhook_url,
-                json=payload
+                data=_dumps_payload(payload),
+                headers=_JSON_HEADERS,
+                timeout=_HTTP_TIMEOUT
             )
             
             if response.status_code < 200 or response.status_code >= 300:
-                self.logger.error(f"Erreur de webhook Slack: {response.status_code} {response.text}")
+                self.logger.error("Erreur de webhook Slack: %s %s", response.status_code, response.text)
             else:
                 self.logger.info("Webhook Slack envoyé")
                 
         except Exception as e:
-            self.logger.error(f"Erreur lors de l'envoi du webhook Slack: {str(e)}")
+            self.logger.error("Erreur lors de l'envoi du webhook Slack: %s", e)
     
     def _play_alert_sound(self):
         """Joue le son d'alerte configuré"""
@@ -534,17 +799,28 @@ class AlertManager:
             
             # Déterminer la plateforme
             if os.name == 'posix':
-                # Linux ou macOS
-                os.system(f"afplay {sound_file}" if sys.platform == 'darwin' else f"aplay {sound_file}")
+                # Linux ou macOS: lecture non bloquante, sans shell
+                player = 'afplay' if sys.platform == 'darwin' else 'aplay'
+                
+                # Interrompre le son précédent s'il est encore en cours
+                if self._sound_proc is not None and self._sound_proc.poll() is None:
+                    self._sound_proc.terminate()
+                
+                self._sound_proc = subprocess.Popen(
+                    [player, sound_file],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
             elif os.name == 'nt':
-                # Windows
+                # Windows (SND_ASYNC: ne bloque pas et remplace le son en cours)
                 import winsound
-                winsound.PlaySound(sound_file, winsound.SND_FILENAME)
+                winsound.PlaySound(sound_file, winsound.SND_FILENAME | winsound.SND_ASYNC)
             
-            self.logger.info(f"Son d'alerte joué: {sound_file}")
+            self.logger.info("Son d'alerte joué: %s", sound_file)
             
         except Exception as e:
-            self.logger.error(f"Erreur lors de la lecture du son d'alerte: {str(e)}")
+            self.logger.error("Erreur lors de la lecture du son d'alerte: %s", e)
     
     def test_all_alerts(self, image_path: Optional[str] = None) -> Dict[str, bool]:
         """
@@ -556,12 +832,15 @@ class AlertManager:
         Returns:
             Dictionnaire des résultats de test
         """
+        # Horodatage commun à tous les tests
+        timestamps = _format_timestamps()
+        
         # Créer des informations de détection factices
         test_detection = {
             'class_name': 'Test',
             'zone': 'Test',
             'confidence': 0.99,
-            'time': datetime.now().isoformat()
+            'time': timestamps[0]
         }
         
         # Résultats des tests
@@ -572,37 +851,39 @@ class AlertManager:
             'sound': False
         }
         
+        flags = self._flags
+        
         # Tester l'email
-        if self.alert_config.get('email_enabled', False):
+        if flags.email:
             try:
-                self._send_email_alert(test_detection, image_path)
+                self._send_email_alert(test_detection, image_path, timestamps)
                 results['email'] = True
             except Exception as e:
-                self.logger.error(f"Test email échoué: {str(e)}")
+                self.logger.error("Test email échoué: %s", e)
         
         # Tester la notification système
-        if self.alert_config.get('notification_enabled', True):
+        if flags.notification:
             try:
                 self._send_system_notification(test_detection)
                 results['notification'] = True
             except Exception as e:
-                self.logger.error(f"Test notification système échoué: {str(e)}")
+                self.logger.error("Test notification système échoué: %s", e)
         
         # Tester le webhook
-        if self.alert_config.get('webhook_enabled', False):
+        if flags.webhook:
             try:
-                self._send_webhook(test_detection, image_path)
+                self._send_webhook(test_detection, image_path, timestamps)
                 results['webhook'] = True
             except Exception as e:
-                self.logger.error(f"Test webhook échoué: {str(e)}")
+                self.logger.error("Test webhook échoué: %s", e)
         
         # Tester le son
-        if self.alert_config.get('sound_alert', False):
+        if flags.sound:
             try:
                 self._play_alert_sound()
                 results['sound'] = True
             except Exception as e:
-                self.logger.error(f"Test son échoué: {str(e)}")
+                self.logger.error("Test son échoué: %s", e)
         
         return results
 
@@ -8,6 +8,9 @@ Fournit des fonctions pour configurer et utiliser le système de journalisation
 
 import os
 import sys
+import queue
+import atexit
+import functools
 import logging
 import logging.handlers
 from datetime import datetime
@@ -25,19 +28,20 @@ logging.addLevelName(PERFORMANCE, "PERFORMANCE")
 # Ajouter une méthode pour logger les performances
 def log_performance(self, message, *args, **kwargs):
     """Log un message de performance au niveau PERFORMANCE"""
-    self.log(PERFORMANCE, message, *args, **kwargs)
+    if self.isEnabledFor(PERFORMANCE):
+        self._log(PERFORMANCE, message, args, **kwargs)
 
 # Ajouter la méthode à la classe Logger
 logging.Logger.performance = log_performance
 
+@functools.lru_cache(maxsize=1)
 def get_log_path() -> str:
-    """Retourne le chemin du dossier de logs"""
+    """Retourne le chemin du dossier de logs (calculé et créé une seule fois)"""
     base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     log_folder = os.path.join(base_path, 'logs')
     
     # Créer le dossier si nécessaire
-    if not os.path.exists(log_folder):
-        os.makedirs(log_folder, exist_ok=True)
+    os.makedirs(log_folder, exist_ok=True)
     
     return log_folder
 
@@ -70,12 +74,15 @@ def setup_logger(
     # Format des logs
     formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
     
+    # Handlers effectifs, alimentés en arrière-plan par un QueueListener
+    handlers = []
+    
     # Log vers la console
     if log_to_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
         console_handler.setLevel(level)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # Log vers un fichier
     if log_to_file:
@@ -89,11 +96,42 @@ def setup_logger(
         )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(level)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Les écritures (console, fichier, rotation) sont faites par le thread du listener:
+    # les threads de capture et de détection ne font que déposer l'enregistrement dans la file
+    if handlers:
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        logger.queue_listener = listener
+        
+        # Vider la file et fermer les fichiers à la sortie du programme
+        atexit.register(stop_logger, logger)
     
     logger.info(f"Logger {logger_name} configuré avec le niveau {logging.getLevelName(level)}")
     return logger
 
+def stop_logger(logger: logging.Logger):
+    """
+    Arrête le thread d'écriture d'un logger configuré par setup_logger
+    
+    Les enregistrements encore en file sont écrits avant l'arrêt.
+    
+    Args:
+        logger: Logger à arrêter
+    """
+    listener = getattr(logger, 'queue_listener', None)
+    if listener is None:
+        return
+    
+    logger.queue_listener = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
 def get_module_logger(module_name: str) -> logging.Logger:
     """
     Crée un logger pour un module spécifique
@@ -13,16 +13,137 @@ import json
 import csv
 import logging
 import tempfile
+import threading
+import functools
+import heapq
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple, Union
 
+import cv2
+
+# Import conditionnel d'orjson pour accélérer la lecture/écriture de l'historique et des exports
+try:
+    import orjson
+    
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _json_dumps(data: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _json_dumps(data: Any, indent: bool = False) -> bytes:
+        return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
 from utils.logger import get_module_logger
 
+# Taille du tampon d'écriture des exports et de l'historique (1 Mio)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Drapeaux d'ouverture des images encodées (O_BINARY n'existe que sous Windows)
+_IMAGE_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+def _write_bytes(path: str, data) -> None:
+    """
+    Écrit un tampon complet dans un fichier sans objet fichier Python intermédiaire
+    
+    Args:
+        path: Chemin de destination
+        data: Données à écrire (bytes ou tableau numpy d'octets)
+    """
+    view = memoryview(data).cast('B')
+    fd = os.open(path, _IMAGE_OPEN_FLAGS, 0o666)
+    try:
+        # Une seule écriture en général; boucle pour les écritures partielles
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+def _discard_temp_file(path: str) -> None:
+    """
+    Supprime un fichier temporaire laissé par une écriture interrompue
+    
+    Args:
+        path: Chemin du fichier temporaire
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+# Intervalle de vidage du journal de l'historique par le thread d'arrière-plan (secondes)
+_HISTORY_FLUSH_INTERVAL = 2.0
+
+# Types sérialisables tels quels: test de type exact avant les conversions (numpy, objets)
+_SAFE_TYPES = (str, int, float, bool, list, dict, tuple, type(None))
+_SAFE_TYPES_SET = frozenset(_SAFE_TYPES)
+
+@functools.lru_cache(maxsize=4096)
+def _iso_from_timestamp(timestamp: float) -> str:
+    """
+    Formate un horodatage de fichier en ISO 8601 (mis en cache: les listes et statistiques
+    reformatent souvent les mêmes dates de modification)
+    
+    Args:
+        timestamp: Horodatage en secondes
+        
+    Returns:
+        Date au format ISO 8601
+    """
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+# Nombre de suppressions simultanées lors du nettoyage (latence des unlink sur disques réseau)
+_CLEANUP_WORKERS = 8
+
+@functools.lru_cache(maxsize=16384)
+def _parse_iso_timestamp(value: str) -> float:
+    """
+    Convertit une date ISO 8601 en horodatage epoch (mise en cache: les mêmes dates
+    d'historique sont comparées à chaque nettoyage et export)
+    
+    Args:
+        value: Date au format ISO 8601
+        
+    Returns:
+        Horodatage en secondes
+    """
+    return datetime.fromisoformat(value).timestamp()
+
+def _entry_timestamp(entry: Dict[str, Any]) -> float:
+    """
+    Retourne l'horodatage epoch d'une entrée d'historique, sans modifier l'entrée
+    
+    Args:
+        entry: Entrée d'historique
+        
+    Returns:
+        Horodatage en secondes
+        
+    Raises:
+        KeyError: Si l'entrée n'a pas d'horodatage
+        ValueError, TypeError: Si l'horodatage est invalide
+    """
+    return _parse_iso_timestamp(entry['time'])
+
 class StorageManager:
     """
     Gestionnaire de stockage pour les fichiers de l'application
     """
     
+    # Extensions listées par get_file_list (les fichiers temporaires et autres sont ignorés)
+    VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mkv', '.mov'})
+    IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.bmp'})
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialise le gestionnaire de stockage
@@ -41,13 +162,71 @@ class StorageManager:
         self.videos_dir = self.storage_config.get('videos_dir', os.path.join(self.base_dir, 'videos'))
         self.images_dir = self.storage_config.get('images_dir', os.path.join(self.base_dir, 'images'))
         self.exports_dir = self.storage_config.get('exports_dir', 'exports')
+        self._update_path_prefixes()
         
         # Paramètres de nettoyage
         self.auto_cleanup = self.storage_config.get('auto_cleanup', True)
         self.max_storage_days = self.storage_config.get('max_storage_days', 30)
         
-        # Fichier d'historique des détections
+        # Quota d'espace disque (0: illimité): au-delà du seuil haut, les fichiers les plus
+        # anciens sont supprimés jusqu'à repasser sous le seuil bas
+        self.max_storage_bytes = int(self.storage_config.get('max_storage_mb', 0)) * 1024 * 1024
+        self.upper_watermark = self.storage_config.get('upper_watermark', 0.9)
+        self.lower_watermark = self.storage_config.get('lower_watermark', 0.85)
+        self._quota_lock = threading.Lock()
+        
+        # Fichier d'historique des détections (instantané JSON) et journal des ajouts (NDJSON)
         self.history_file = os.path.join(self.base_dir, 'detection_history.json')
+        self.history_log_file = os.path.join(self.base_dir, 'detection_history.ndjson')
+        self._history_fp = None
+        self._log_entries = 0
+        self._max_history_entries = 10000
+        
+        # Vidage et compactage de l'historique par un thread dédié (hors du thread de détection)
+        self._history_lock = threading.RLock()
+        self._history_dirty = threading.Event()
+        self._flusher_stop = threading.Event()
+        self._flusher_thread = None
+        
+        # Format et paramètres d'encodage des images, calculés une fois
+        image_format = self.storage_config.get('image_format', 'jpg').lower()
+        self._image_ext = f".{image_format}"
+        self._encode_params: List[int] = []
+        if image_format in ['jpg', 'jpeg']:
+            quality = self.storage_config.get('image_quality', 95)
+            self._encode_params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+        elif image_format == 'png':
+            compression = self.storage_config.get('png_compression', 9)
+            self._encode_params = [cv2.IMWRITE_PNG_COMPRESSION, compression]
+        
+        # Extensions listées par type, y compris les formats configurés
+        video_format = self.storage_config.get('video_format', 'mp4').lower()
+        self._listing_exts = {
+            'video': self.VIDEO_EXTS | {f".{video_format}"},
+            'image': self.IMAGE_EXTS | {self._image_ext}
+        }
+        
+        # Pool d'écriture des images: l'encodage et l'écriture sortent du thread de détection
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='storage-io')
+        
+        # Statistiques par répertoire, calculées au premier appel puis tenues à jour
+        # (None: à recalculer par un parcours complet)
+        self._dir_stats: Dict[str, Optional[Dict[str, Any]]] = {'video': None, 'image': None, 'exports': None}
+        # Index des fichiers triés par date de modification: (mtimes, [(chemin, nom, taille)])
+        self._file_index: Dict[str, Optional[Tuple[List[float], List[Tuple[str, str, int]]]]] = {
+            'video': None, 'image': None
+        }
+        # Date de modification des répertoires à la construction de l'index: un changement
+        # extérieur (copie, suppression manuelle, enregistreur vidéo) force un nouveau parcours
+        self._file_index_mtime: Dict[str, Optional[float]] = {'video': None, 'image': None}
+        self._stats_lock = threading.Lock()
+        
+        # Répertoires dont l'existence est connue (évite un mkdir par fichier)
+        self._dirs_ready = set()
+        
+        # Horodatage des noms de fichiers, formaté une fois par seconde (seconde, texte, compteur)
+        self._ts_cache = (0, '', 0)
+        self._ts_lock = threading.Lock()
         
         # Créer les répertoires s'ils n'existent pas
         try:
@@ -60,6 +239,10 @@ class StorageManager:
         # Charger l'historique des détections
         self.detection_history = self._load_detection_history()
         
+        self._flusher_thread = threading.Thread(target=self._history_flush_loop,
+                                                name='storage-history-flusher', daemon=True)
+        self._flusher_thread.start()
+        
         self.logger.info("Gestionnaire de stockage initialisé")
         
         # Nettoyage automatique au démarrage si activé
@@ -99,6 +282,8 @@ class StorageManager:
         self.images_dir = os.path.join(app_temp_dir, 'images')
         self.exports_dir = os.path.join(app_temp_dir, 'exports')
         self.history_file = os.path.join(app_temp_dir, 'detection_history.json')
+        self.history_log_file = os.path.join(app_temp_dir, 'detection_history.ndjson')
+        self._update_path_prefixes()
         
         os.makedirs(self.base_dir, exist_ok=True)
         os.makedirs(self.videos_dir, exist_ok=True)
@@ -107,26 +292,67 @@ class StorageManager:
         
         self.logger.warning(f"Utilisation des répertoires temporaires: {app_temp_dir}")
     
+    def _update_path_prefixes(self):
+        """Précalcule les préfixes des répertoires (terminés par un séparateur) pour construire les chemins par concaténation"""
+        self._videos_prefix = os.path.join(self.videos_dir, '')
+        self._images_prefix = os.path.join(self.images_dir, '')
+        self._exports_prefix = os.path.join(self.exports_dir, '')
+    
+    def _ensure_dir(self, directory: str):
+        """
+        Crée un répertoire s'il n'est pas déjà connu comme existant
+        
+        Args:
+            directory: Répertoire à créer
+        """
+        if directory not in self._dirs_ready:
+            os.makedirs(directory, exist_ok=True)
+            self._dirs_ready.add(directory)
+    
+    def _filename_timestamp(self) -> str:
+        """
+        Retourne l'horodatage des noms de fichiers, suffixé d'un compteur pour les fichiers
+        créés dans la même seconde
+        
+        Returns:
+            Horodatage au format AAAAMMJJ_HHMMSS[_N]
+        """
+        now = int(time.time())
+        
+        with self._ts_lock:
+            second, formatted, sequence = self._ts_cache
+            if now != second:
+                formatted = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+                sequence = 0
+            else:
+                sequence += 1
+            self._ts_cache = (now, formatted, sequence)
+        
+        return f"{formatted}_{sequence}" if sequence else formatted
+    
     def _load_detection_history(self) -> List[Dict[str, Any]]:
         """
         Charge l'historique des détections depuis le fichier
         
+        L'instantané JSON est complété par les entrées ajoutées depuis au journal NDJSON.
+        
         Returns:
             Liste des détections historiques
         """
         if not os.path.exists(self.history_file):
-            return []
+            return self._load_history_log()
         
         try:
-            with open(self.history_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-                self.logger.info(f"Historique chargé: {len(history)} entrées")
-                return history
+            with open(self.history_file, 'rb') as f:
+                history = _json_loads(f.read())
+            history.extend(self._load_history_log())
+            self.logger.info(f"Historique chargé: {len(history)} entrées")
+            return history
         except json.JSONDecodeError as json_error:
             self.logger.error(f"Erreur de format JSON dans l'historique: {str(json_error)}")
             # Tenter de récupérer le fichier corrompu
             self._backup_corrupted_history()
-            return []
+            return self._load_history_log()
         except (IOError, PermissionError) as io_error:
             self.logger.error(f"Erreur d'accès à l'historique: {str(io_error)}")
             return []
@@ -134,6 +360,94 @@ class StorageManager:
             self.logger.error(f"Erreur inattendue lors du chargement de l'historique: {str(e)}")
             return []
     
+    def _load_history_log(self) -> List[Dict[str, Any]]:
+        """
+        Charge les entrées du journal NDJSON des ajouts
+        
+        Returns:
+            Liste des détections journalisées (les lignes illisibles sont ignorées)
+        """
+        entries = []
+        
+        try:
+            with open(self.history_log_file, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entries.append(_json_loads(line))
+                    except ValueError:
+                        # Dernière ligne tronquée par un arrêt brutal
+                        self.logger.warning("Ligne illisible ignorée dans le journal de l'historique")
+        except FileNotFoundError:
+            pass
+        except (IOError, PermissionError) as io_error:
+            self.logger.error(f"Erreur d'accès au journal de l'historique: {str(io_error)}")
+        
+        self._log_entries = len(entries)
+        return entries
+    
+    def _append_history_log(self, entry: Dict[str, Any]):
+        """
+        Ajoute une entrée au journal NDJSON (écriture en O(1), sans réécrire l'historique)
+        
+        Args:
+            entry: Détection à journaliser
+        """
+        if self._history_fp is None:
+            self._history_fp = open(self.history_log_file, 'ab', buffering=64 * 1024)
+        
+        self._history_fp.write(_json_dumps(entry) + b'\n')
+        
+        self._log_entries += 1
+        
+        # Le tampon est vidé par le thread d'arrière-plan, qui regroupe les ajouts rapprochés
+        self._history_dirty.set()
+    
+    def _history_flush_loop(self):
+        """Vide périodiquement le journal de l'historique et le compacte lorsqu'il devient trop long"""
+        while not self._flusher_stop.wait(_HISTORY_FLUSH_INTERVAL):
+            if not self._history_dirty.is_set():
+                continue
+            self._history_dirty.clear()
+            
+            try:
+                with self._history_lock:
+                    if self._history_fp is not None:
+                        self._history_fp.flush()
+                    
+                    if self._log_entries >= self._max_history_entries:
+                        self.save_detection_history(self._max_history_entries)
+            except Exception as e:
+                self.logger.error(f"Erreur lors du vidage du journal de l'historique: {str(e)}")
+    
+    def _close_history_log(self, sync: bool = False):
+        """
+        Vide et ferme le journal NDJSON
+        
+        Args:
+            sync: Forcer l'écriture sur disque (fsync) avant la fermeture
+        """
+        if self._history_fp is not None:
+            try:
+                if sync:
+                    self._history_fp.flush()
+                    os.fsync(self._history_fp.fileno())
+                self._history_fp.close()
+            finally:
+                self._history_fp = None
+    
+    def close(self):
+        """Termine les écritures d'images en cours, puis vide, synchronise et ferme le journal des détections"""
+        self._io_pool.shutdown(wait=True)
+        
+        self._flusher_stop.set()
+        if self._flusher_thread is not None:
+            self._flusher_thread.join()
+        
+        with self._history_lock:
+            self._close_history_log(sync=True)
+    
     def _backup_corrupted_history(self):
         """Sauvegarde un fichier d'historique corrompu"""
         try:
@@ -149,6 +463,23 @@ class StorageManager:
         """
         Sauvegarde l'historique des détections dans le fichier
         
+        L'instantané JSON est réécrit en entier et le journal NDJSON des ajouts est vidé
+        (compactage).
+        
+        Args:
+            max_entries: Nombre maximal d'entrées à conserver
+            
+        Returns:
+            True si la sauvegarde a réussi, False sinon
+        """
+        # Aucun ajout ne doit être journalisé entre l'instantané et le vidage du journal
+        with self._history_lock:
+            return self._save_detection_history(max_entries)
+    
+    def _save_detection_history(self, max_entries: int) -> bool:
+        """
+        Réécrit l'instantané JSON et vide le journal (appelé avec le verrou de l'historique)
+        
         Args:
             max_entries: Nombre maximal d'entrées à conserver
             
@@ -166,26 +497,34 @@ class StorageManager:
             self.logger.error(f"Erreur lors de la création du répertoire d'historique: {str(dir_error)}")
             return False
         
+        temp_file = f"{self.history_file}.tmp"
         try:
-            # Écrire dans un fichier temporaire d'abord (pour éviter la corruption)
-            temp_file = f"{self.history_file}.tmp"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.detection_history, f, indent=2)
-            
-            # Remplacer le fichier original par le fichier temporaire
-            if os.path.exists(temp_file):
-                if os.path.exists(self.history_file):
-                    os.replace(temp_file, self.history_file)
-                else:
-                    os.rename(temp_file, self.history_file)
-                
+            # Écrire dans un fichier temporaire d'abord (pour éviter la corruption), en JSON compact:
+            # fichier lu uniquement par l'application, l'indentation reste réservée aux exports
+            with open(temp_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(_json_dumps(self.detection_history))
+                # Données sur disque avant le renommage: le journal est tronqué juste après
+                f.flush()
+                os.fsync(f.fileno())
+            
+            # Remplacer le fichier original par le fichier temporaire (renommage atomique,
+            # que la destination existe ou non)
+            os.replace(temp_file, self.history_file)
+            
+            # Les entrées journalisées sont désormais dans l'instantané
+            self._close_history_log()
+            open(self.history_log_file, 'wb').close()
+            self._log_entries = 0
+            
             self.logger.info(f"Historique sauvegardé: {len(self.detection_history)} entrées")
             return True
         except (IOError, OSError, PermissionError) as e:
             self.logger.error(f"Erreur lors de la sauvegarde de l'historique: {str(e)}")
+            _discard_temp_file(temp_file)
             return False
         except Exception as e:
             self.logger.error(f"Erreur inattendue lors de la sauvegarde de l'historique: {str(e)}")
+            _discard_temp_file(temp_file)
             return False
     
     def add_detection(self, detection_info: Dict[str, Any]) -> bool:
@@ -206,40 +545,45 @@ class StorageManager:
             # Nettoyer les valeurs non sérialisables
             clean_info = {}
             for key, value in detection_info.items():
+                # Cas courant: valeur déjà sérialisable
+                if type(value) in _SAFE_TYPES_SET:
+                    clean_info[key] = value
                 # Convertir les tableaux numpy en listes
-                if hasattr(value, 'tolist'):
+                elif hasattr(value, 'tolist'):
                     clean_info[key] = value.tolist()
                 # Convertir les objets personnalisés en chaînes
-                elif not isinstance(value, (str, int, float, bool, list, dict, tuple, type(None))):
+                elif not isinstance(value, _SAFE_TYPES):
                     clean_info[key] = str(value)
                 else:
                     clean_info[key] = value
             
-            # Ajouter à l'historique
-            self.detection_history.append(clean_info)
-            
-            # Sauvegarder tous les 10 ajouts pour éviter les écritures fréquentes
-            if len(self.detection_history) % 10 == 0:
-                self.save_detection_history()
+            # Ajouter à l'historique et au journal des ajouts (vidage et compactage en arrière-plan)
+            with self._history_lock:
+                self.detection_history.append(clean_info)
+                self._append_history_log(clean_info)
             
             return True
         except Exception as e:
             self.logger.error(f"Erreur lors de l'ajout d'une détection: {str(e)}")
             return False
     
-    def save_detection_image(self, image, detection_info: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    def save_detection_image(self, image,
+                             detection_info: Optional[Dict[str, Any]] = None) -> Optional[Future]:
         """
         Sauvegarde une image de détection
         
+        L'encodage et l'écriture sont effectués en arrière-plan: le fichier n'existe pas
+        encore au retour. Les appelants qui transmettent le chemin (alertes, interface)
+        doivent attendre le résultat du Future avant d'ouvrir le fichier.
+        
         Args:
             image: Image à sauvegarder (numpy array)
             detection_info: Informations sur la détection
             
         Returns:
-            Chemin de l'image sauvegardée, ou None en cas d'erreur
+            Future dont le résultat est le chemin de l'image écrite (None si l'écriture
+            a échoué), ou None si l'image n'a pas pu être mise en file
         """
-        import cv2
-        
         try:
             # Vérifier que l'image est valide
             if image is None or image.size == 0:
@@ -247,7 +591,7 @@ class StorageManager:
                 return None
                 
             # Créer un nom de fichier avec horodatage
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._filename_timestamp()
             
             # Ajouter des métadonnées au nom si disponibles
             filename_parts = ["detection", timestamp]
@@ -262,55 +606,72 @@ class StorageManager:
                     zone_str = str(detection_info['zone']).replace('/', '_')
                     filename_parts.append(f"zone{zone_str}")
             
-            # Obtenir le format d'image
-            image_format = self.storage_config.get('image_format', 'jpg').lower()
-            filename = "_".join(filename_parts) + f".{image_format}"
+            filename = "_".join(filename_parts) + self._image_ext
             
             # Créer le chemin complet
             try:
                 # Vérifier que le répertoire existe
-                os.makedirs(self.images_dir, exist_ok=True)
-                image_path = os.path.join(self.images_dir, filename)
+                self._ensure_dir(self.images_dir)
+                image_path = self._images_prefix + filename
+                stats_prefix = 'image'
             except Exception as dir_error:
                 self.logger.error(f"Erreur lors de la création du répertoire d'images: {str(dir_error)}")
                 # Utiliser un répertoire temporaire
                 temp_dir = os.path.join(tempfile.gettempdir(), 'detectcam', 'images')
                 os.makedirs(temp_dir, exist_ok=True)
                 image_path = os.path.join(temp_dir, filename)
+                stats_prefix = None
             
-            # Définir la qualité
-            quality_params = []
-            if image_format in ['jpg', 'jpeg']:
-                quality = self.storage_config.get('image_quality', 95)
-                quality_params = [cv2.IMWRITE_JPEG_QUALITY, quality]
-            elif image_format == 'png':
-                compression = self.storage_config.get('png_compression', 9)
-                quality_params = [cv2.IMWRITE_PNG_COMPRESSION, compression]
-            
-            # Sauvegarder l'image
-            try:
-                if quality_params:
-                    success = cv2.imwrite(image_path, image, quality_params)
-                else:
-                    success = cv2.imwrite(image_path, image)
-                
-                if not success:
-                    raise IOError(f"Échec de l'écriture de l'image: {image_path}")
-                
-                # Vérifier que le fichier a bien été créé
-                if not os.path.exists(image_path) or os.path.getsize(image_path) == 0:
-                    raise IOError(f"Fichier image vide ou inexistant: {image_path}")
-                
-                self.logger.info(f"Image sauvegardée: {image_path}")
-                return image_path
-            except Exception as cv_error:
-                self.logger.error(f"Erreur OpenCV lors de la sauvegarde de l'image: {str(cv_error)}")
-                return None
+            # Encoder et écrire l'image en arrière-plan (copie: l'appelant peut réutiliser sa frame)
+            return self._io_pool.submit(self._encode_and_write, image.copy(), image_path,
+                                        self._image_ext, self._encode_params, stats_prefix)
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la sauvegarde de l'image: {str(e)}")
             return None
     
+    def _encode_and_write(self, image, image_path: str, extension: str, params: List[int],
+                          stats_prefix: Optional[str] = None) -> Optional[str]:
+        """
+        Encode une image en mémoire puis l'écrit sur disque en une seule écriture
+        
+        Args:
+            image: Image à encoder
+            image_path: Chemin de destination
+            extension: Extension déterminant le format d'encodage (ex: '.jpg')
+            params: Paramètres d'encodage OpenCV
+            stats_prefix: Statistiques de répertoire à mettre à jour ('image'), ou None
+            
+        Returns:
+            Chemin de l'image écrite, ou None en cas d'erreur
+        """
+        try:
+            success, encoded = cv2.imencode(extension, image, params)
+            if not success or encoded.size == 0:
+                raise IOError(f"Échec de l'encodage de l'image: {image_path}")
+            
+            # Date du répertoire avant l'écriture, pour valider la mise à jour de l'index
+            image_dir = os.path.dirname(image_path)
+            previous_dir_mtime = self._directory_mtime(image_dir)
+            try:
+                _write_bytes(image_path, encoded)
+            except FileNotFoundError:
+                # Répertoire supprimé pendant l'exécution: le recréer et réessayer une fois
+                self._dirs_ready.discard(image_dir)
+                self._ensure_dir(image_dir)
+                previous_dir_mtime = None
+                _write_bytes(image_path, encoded)
+            
+            if stats_prefix:
+                self._record_file_added(stats_prefix, image_path, encoded.size, previous_dir_mtime)
+                self.enforce_quota()
+            
+            self.logger.info(f"Image sauvegardée: {image_path}")
+            return image_path
+        except Exception as cv_error:
+            self.logger.error(f"Erreur OpenCV lors de la sauvegarde de l'image: {str(cv_error)}")
+            return None
+    
     def get_video_path(self, suffix: str = "") -> str:
         """
         Génère un chemin de fichier vidéo
@@ -323,7 +684,7 @@ class StorageManager:
         """
         try:
             # Créer un nom de fichier avec horodatage
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._filename_timestamp()
             
             # Ajouter le suffixe s'il est fourni
             filename_parts = ["detection", timestamp]
@@ -338,8 +699,11 @@ class StorageManager:
             
             # Vérifier/créer le répertoire
             try:
-                os.makedirs(self.videos_dir, exist_ok=True)
-                return os.path.join(self.videos_dir, filename)
+                self._ensure_dir(self.videos_dir)
+                # Place libérée pour l'enregistrement en arrière-plan, hors du thread de capture;
+                # la vidéo est comptée à sa fermeture (record_video_file)
+                self._io_pool.submit(self.enforce_quota)
+                return self._videos_prefix + filename
             except Exception as dir_error:
                 self.logger.error(f"Erreur lors de la création du répertoire vidéo: {str(dir_error)}")
                 # Utiliser un répertoire temporaire
@@ -353,6 +717,31 @@ class StorageManager:
             os.makedirs(backup_dir, exist_ok=True)
             return os.path.join(backup_dir, f"detection_backup_{int(time.time())}.mp4")
     
+    def record_video_file(self, video_path: str) -> bool:
+        """
+        Met à jour les statistiques de stockage après la fermeture d'une vidéo
+        obtenue par get_video_path
+        
+        Args:
+            video_path: Chemin de la vidéo enregistrée
+            
+        Returns:
+            True si la vidéo a été prise en compte, False sinon
+        """
+        if not video_path.startswith(self._videos_prefix):
+            return False
+        
+        try:
+            file_size = os.path.getsize(video_path)
+            
+            # Date du répertoire avant l'écriture inconnue: l'index des vidéos sera reconstruit
+            self._record_file_added('video', video_path, file_size)
+            self._io_pool.submit(self.enforce_quota)
+            return True
+        except Exception as e:
+            self.logger.error(f"Erreur lors de la prise en compte de la vidéo {video_path}: {str(e)}")
+            return False
+    
     def cleanup_old_files(self, days: Optional[int] = None) -> Tuple[int, int]:
         """
         Supprime les fichiers plus anciens que le nombre de jours spécifié
@@ -374,41 +763,46 @@ class StorageManager:
             files_deleted = 0
             space_freed = 0
             
-            # Nettoyer les vidéos
-            deleted, freed = self._cleanup_directory(self.videos_dir, cutoff_timestamp)
-            files_deleted += deleted
-            space_freed += freed
-            
-            # Nettoyer les images
-            deleted, freed = self._cleanup_directory(self.images_dir, cutoff_timestamp)
-            files_deleted += deleted
-            space_freed += freed
+            # Nettoyer les vidéos, les images et les exports en parallèle (répertoires indépendants)
+            directories = ((self.videos_dir, 'video'), (self.images_dir, 'image'), (self.exports_dir, 'exports'))
+            with ThreadPoolExecutor(max_workers=len(directories),
+                                    thread_name_prefix='storage-cleanup-dir') as pool:
+                futures = [pool.submit(self._cleanup_directory, directory, cutoff_timestamp, prefix)
+                           for directory, prefix in directories]
+                for future in futures:
+                    deleted, freed = future.result()
+                    files_deleted += deleted
+                    space_freed += freed
             
-            # Nettoyer les exports
-            deleted, freed = self._cleanup_directory(self.exports_dir, cutoff_timestamp)
+            # Appliquer le quota d'espace disque sur les fichiers restants
+            deleted, freed = self.enforce_quota()
             files_deleted += deleted
             space_freed += freed
             
-            # Nettoyer l'historique des détections
-            if self.detection_history:
-                original_count = len(self.detection_history)
-                filtered_history = []
-                
-                for entry in self.detection_history:
-                    try:
-                        entry_time = entry.get('time', '2000-01-01T00:00:00')
-                        if isinstance(entry_time, str):
-                            detection_date = datetime.fromisoformat(entry_time)
-                            if detection_date > cutoff_date:
+            # Nettoyer l'historique des détections (horodatages analysés une seule fois par entrée)
+            with self._history_lock:
+                if self.detection_history:
+                    original_count = len(self.detection_history)
+                    filtered_history = self._prune_sorted_history(cutoff_timestamp)
+                    
+                    if filtered_history is None:
+                        # Historique non chronologique: filtrage complet
+                        filtered_history = []
+                        for entry in self.detection_history:
+                            try:
+                                if _entry_timestamp(entry) > cutoff_timestamp:
+                                    filtered_history.append(entry)
+                            except KeyError:
+                                # Entrée sans horodatage: considérée comme ancienne
+                                continue
+                            except (ValueError, TypeError):
+                                # Conserver les entrées avec des dates invalides
                                 filtered_history.append(entry)
-                    except (ValueError, TypeError):
-                        # Conserver les entrées avec des dates invalides
-                        filtered_history.append(entry)
-                
-                if len(filtered_history) < original_count:
-                    self.detection_history = filtered_history
-                    self.save_detection_history()
-                    self.logger.info(f"Historique nettoyé: {original_count - len(filtered_history)} entrées supprimées")
+                    
+                    if len(filtered_history) < original_count:
+                        self.detection_history = filtered_history
+                        self.save_detection_history()
+                        self.logger.info(f"Historique nettoyé: {original_count - len(filtered_history)} entrées supprimées")
             
             self.logger.info(f"Nettoyage terminé: {files_deleted} fichiers supprimés, {space_freed / (1024*1024):.2f} MB libérés")
             return files_deleted, space_freed
@@ -417,13 +811,53 @@ class StorageManager:
             self.logger.error(f"Erreur lors du nettoyage des fichiers: {str(e)}")
             return 0, 0
     
-    def _cleanup_directory(self, directory: str, cutoff_timestamp: float) -> Tuple[int, int]:
+    def _prune_sorted_history(self, cutoff_timestamp: float) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retire les entrées anciennes en tête d'un historique chronologique, par dichotomie
+        
+        Les entrées sont ajoutées dans l'ordre chronologique: seules les entrées retirées sont
+        vérifiées, les entrées anciennes restées après la coupure seront retirées plus tard.
+        
+        Args:
+            cutoff_timestamp: Horodatage limite
+            
+        Returns:
+            Historique sans les entrées anciennes de tête, ou None si l'historique ne s'y prête pas
+            (dates invalides ou désordonnées)
+        """
+        history = self.detection_history
+        
+        try:
+            # Cas courant: l'entrée la plus ancienne est récente, rien à retirer
+            if _entry_timestamp(history[0]) > cutoff_timestamp:
+                return history
+            
+            low, high = 0, len(history)
+            while low < high:
+                middle = (low + high) // 2
+                if _entry_timestamp(history[middle]) > cutoff_timestamp:
+                    high = middle
+                else:
+                    low = middle + 1
+            
+            # Vérifier que toutes les entrées retirées sont bien anciennes
+            for entry in history[:low]:
+                if _entry_timestamp(entry) > cutoff_timestamp:
+                    return None
+        except (KeyError, ValueError, TypeError):
+            return None
+        
+        return history[low:]
+    
+    def _cleanup_directory(self, directory: str, cutoff_timestamp: float,
+                           stats_prefix: Optional[str] = None) -> Tuple[int, int]:
         """
         Supprime les fichiers anciens d'un répertoire
         
         Args:
             directory: Répertoire à nettoyer
             cutoff_timestamp: Horodatage limite
+            stats_prefix: Statistiques de répertoire à mettre à jour ('video', 'image', 'exports'), ou None
             
         Returns:
             Tuple (nombre de fichiers supprimés, espace libéré en octets)
@@ -435,44 +869,137 @@ class StorageManager:
         space_freed = 0
         
         try:
-            for filename in os.listdir(directory):
-                filepath = os.path.join(directory, filename)
-                
-                try:
-                    # Ignorer les sous-répertoires
-                    if os.path.isdir(filepath):
-                        continue
-                    
-                    # Vérifier l'âge du fichier (avec protection contre les erreurs)
-                    try:
-                        file_timestamp = os.path.getmtime(filepath)
-                    except (FileNotFoundError, PermissionError, OSError):
-                        continue
-                    
-                    if file_timestamp < cutoff_timestamp:
-                        try:
-                            # Récupérer la taille avant suppression
-                            try:
-                                file_size = os.path.getsize(filepath)
-                            except:
-                                file_size = 0
-                            
-                            # Supprimer le fichier
-                            os.remove(filepath)
-                            
-                            files_deleted += 1
-                            space_freed += file_size
-                            
-                            self.logger.debug(f"Fichier supprimé: {filepath}")
-                        except (IOError, OSError, PermissionError) as del_error:
-                            self.logger.error(f"Erreur lors de la suppression de {filepath}: {str(del_error)}")
-                except Exception as file_error:
-                    self.logger.error(f"Erreur de traitement du fichier {filename}: {str(file_error)}")
+            # Un seul stat par fichier (âge et taille), trié du plus ancien au plus récent; date
+            # du répertoire lue avant: une création pendant le parcours invalide l'index
+            directory_mtime = self._directory_mtime(directory)
+            candidates = self._scan_directory(directory)
+            
+            # Tous les fichiers après le premier trop récent sont plus récents que la limite
+            old_count = 0
+            for file_mtime, _, _ in candidates:
+                if file_mtime >= cutoff_timestamp:
+                    break
+                old_count += 1
+            old_files = candidates[:old_count]
+            
+            results = self._remove_files(old_files)
+            
+            for deleted, freed in results:
+                files_deleted += deleted
+                space_freed += freed
+            
+            # Le parcours du nettoyage sert aussi de statistiques et d'index pour les survivants
+            if stats_prefix:
+                survivors = [file_info for file_info, (deleted, _) in zip(old_files, results) if not deleted]
+                survivors.extend(candidates[old_count:])
+                self._store_directory_scan(stats_prefix, directory_mtime, survivors)
         except Exception as dir_error:
             self.logger.error(f"Erreur lors du nettoyage du répertoire {directory}: {str(dir_error)}")
         
         return files_deleted, space_freed
     
+    def _remove_files(self, files: List[Tuple[float, int, str]]) -> List[Tuple[int, int]]:
+        """
+        Supprime une liste de fichiers, en parallèle s'il y en a plusieurs
+        
+        Args:
+            files: Fichiers à supprimer (mtime, taille, chemin)
+            
+        Returns:
+            Liste des (nombre de fichiers supprimés, espace libéré), dans l'ordre de la liste
+        """
+        if len(files) == 1:
+            return [self._remove_file(files[0][2], files[0][1])]
+        if not files:
+            return []
+        
+        # Suppressions en parallèle pour recouvrir la latence des appels système
+        with ThreadPoolExecutor(max_workers=_CLEANUP_WORKERS,
+                                thread_name_prefix='storage-cleanup') as pool:
+            return list(pool.map(self._remove_file,
+                                 [file_info[2] for file_info in files],
+                                 [file_info[1] for file_info in files]))
+    
+    def enforce_quota(self) -> Tuple[int, int]:
+        """
+        Supprime les fichiers les plus anciens (tous répertoires confondus) lorsque l'espace
+        utilisé dépasse le seuil haut du quota, jusqu'à repasser sous le seuil bas
+        
+        Returns:
+            Tuple (nombre de fichiers supprimés, espace libéré en octets)
+        """
+        if self.max_storage_bytes <= 0:
+            return 0, 0
+        
+        # Une seule application du quota à la fois (appelée depuis les threads d'écriture)
+        if not self._quota_lock.acquire(blocking=False):
+            return 0, 0
+        
+        try:
+            directories = (('video', self.videos_dir), ('image', self.images_dir), ('exports', self.exports_dir))
+            
+            # Vérification en O(1) sur les statistiques tenues à jour
+            total_size = sum(self._get_cached_directory_stats(directory, prefix)[f'{prefix}_size']
+                             for prefix, directory in directories)
+            if total_size <= self.max_storage_bytes * self.upper_watermark:
+                return 0, 0
+            
+            to_free = total_size - self.max_storage_bytes * self.lower_watermark
+            
+            # Parcours frais et fusion des répertoires triés, du plus ancien au plus récent
+            # (dates des répertoires lues avant les parcours)
+            directory_mtimes = {prefix: self._directory_mtime(directory) for prefix, directory in directories}
+            scans = {prefix: self._scan_directory(directory) for prefix, directory in directories}
+            victims = []
+            selected_size = 0
+            for file_info in heapq.merge(*scans.values(), key=itemgetter(0)):
+                if selected_size >= to_free:
+                    break
+                victims.append(file_info)
+                selected_size += file_info[1]
+            
+            results = self._remove_files(victims)
+            removed = {file_info[2] for file_info, (deleted, _) in zip(victims, results) if deleted}
+            files_deleted = len(removed)
+            space_freed = sum(freed for _, freed in results)
+            
+            # Statistiques et index recalculés à partir des parcours, sans les fichiers supprimés
+            for prefix, directory in directories:
+                self._store_directory_scan(prefix, directory_mtimes[prefix],
+                                           [file_info for file_info in scans[prefix]
+                                            if file_info[2] not in removed])
+            
+            self.logger.info(f"Quota de stockage appliqué: {files_deleted} fichiers supprimés, "
+                             f"{space_freed / (1024*1024):.2f} MB libérés")
+            return files_deleted, space_freed
+        except Exception as e:
+            self.logger.error(f"Erreur lors de l'application du quota de stockage: {str(e)}")
+            return 0, 0
+        finally:
+            self._quota_lock.release()
+    
+    def _remove_file(self, filepath: str, file_size: int) -> Tuple[int, int]:
+        """
+        Supprime un fichier
+        
+        Args:
+            filepath: Chemin du fichier
+            file_size: Taille du fichier en octets
+            
+        Returns:
+            Tuple (nombre de fichiers supprimés, espace libéré en octets)
+        """
+        try:
+            os.remove(filepath)
+            self.logger.debug(f"Fichier supprimé: {filepath}")
+            return 1, file_size
+        except FileNotFoundError:
+            # Déjà supprimé (nettoyage ou quota concurrent)
+            return 0, 0
+        except OSError as del_error:
+            self.logger.error(f"Erreur lors de la suppression de {filepath}: {str(del_error)}")
+            return 0, 0
+    
     def get_storage_stats(self) -> Dict[str, Any]:
         """
         Retourne des statistiques sur l'utilisation du stockage
@@ -494,15 +1021,15 @@ class StorageManager:
         
         try:
             # Statistiques des vidéos
-            video_stats = self._get_directory_stats(self.videos_dir, 'video')
+            video_stats = self._get_cached_directory_stats(self.videos_dir, 'video')
             stats.update(video_stats)
             
             # Statistiques des images
-            image_stats = self._get_directory_stats(self.images_dir, 'image')
+            image_stats = self._get_cached_directory_stats(self.images_dir, 'image')
             stats.update(image_stats)
             
             # Statistiques des exports
-            exports_stats = self._get_directory_stats(self.exports_dir, 'exports')
+            exports_stats = self._get_cached_directory_stats(self.exports_dir, 'exports')
             stats.update(exports_stats)
             
             # Calculer le total
@@ -514,9 +1041,23 @@ class StorageManager:
             self.logger.error(f"Erreur lors du calcul des statistiques de stockage: {str(e)}")
             return stats
     
-    def _get_directory_stats(self, directory: str, prefix: str) -> Dict[str, Any]:
+    def refresh_stats(self) -> Dict[str, Any]:
         """
-        Calcule les statistiques d'un répertoire
+        Recalcule les statistiques de stockage par un parcours complet des répertoires
+        
+        Returns:
+            Dictionnaire des statistiques
+        """
+        with self._stats_lock:
+            for prefix in self._dir_stats:
+                self._dir_stats[prefix] = None
+            for type_name in self._file_index:
+                self._file_index[type_name] = None
+        return self.get_storage_stats()
+    
+    def _get_cached_directory_stats(self, directory: str, prefix: str) -> Dict[str, Any]:
+        """
+        Retourne les statistiques tenues à jour d'un répertoire (parcours complet si nécessaire)
         
         Args:
             directory: Répertoire à analyser
@@ -525,74 +1066,198 @@ class StorageManager:
         Returns:
             Dictionnaire des statistiques
         """
-        stats = {
-            f'{prefix}_size': 0,
-            f'{prefix}_count': 0,
-            f'{prefix}_oldest': None,
-            f'{prefix}_newest': None
-        }
+        with self._stats_lock:
+            stats = self._dir_stats.get(prefix)
+            if stats is None:
+                stats = self._get_directory_stats(directory, prefix)
+                self._dir_stats[prefix] = stats
+            return dict(stats)
+    
+    def _invalidate_directory(self, prefix: str):
+        """
+        Force le recalcul des statistiques et de l'index d'un répertoire au prochain appel
         
-        if not os.path.exists(directory):
-            return stats
+        Args:
+            prefix: Préfixe du répertoire ('video', 'image', 'exports')
+        """
+        with self._stats_lock:
+            self._dir_stats[prefix] = None
+            if prefix in self._file_index:
+                self._file_index[prefix] = None
+    
+    def _record_file_added(self, prefix: str, filepath: str, file_size: int,
+                           previous_dir_mtime: Optional[float] = None):
+        """
+        Met à jour les statistiques d'un répertoire après l'écriture d'un fichier
+        
+        Args:
+            prefix: Préfixe du répertoire ('video', 'image', 'exports')
+            filepath: Chemin du fichier écrit
+            file_size: Taille du fichier en octets
+            previous_dir_mtime: Date du répertoire lue avant l'écriture; None si inconnue
+                (l'index est alors invalidé)
+        """
+        file_timestamp = time.time()
+        directory_mtime = self._directory_mtime(os.path.dirname(filepath))
+        
+        with self._stats_lock:
+            index = self._file_index.get(prefix)
+            if index is not None:
+                if previous_dir_mtime is not None and self._file_index_mtime[prefix] == previous_dir_mtime:
+                    # Aucune autre modification du répertoire depuis l'indexation: l'index reste à jour
+                    mtimes, files = index
+                    position = bisect_right(mtimes, file_timestamp)
+                    mtimes.insert(position, file_timestamp)
+                    files.insert(position, (filepath, os.path.basename(filepath), file_size))
+                    self._file_index_mtime[prefix] = directory_mtime
+                else:
+                    # Répertoire modifié par ailleurs: réindexation au prochain appel
+                    self._file_index[prefix] = None
+            
+            stats = self._dir_stats.get(prefix)
+            if stats is None:
+                return
+            
+            stats[f'{prefix}_size'] += file_size
+            stats[f'{prefix}_count'] += 1
+            
+            file_info = {'path': filepath, 'timestamp': _iso_from_timestamp(file_timestamp)}
+            stats[f'{prefix}_newest'] = file_info
+            if stats[f'{prefix}_oldest'] is None:
+                stats[f'{prefix}_oldest'] = file_info
+    
+    def _store_directory_scan(self, prefix: str, directory_mtime: Optional[float],
+                              files: List[Tuple[float, int, str]]):
+        """
+        Remplace les statistiques et l'index d'un répertoire par le résultat d'un parcours
+        
+        Args:
+            prefix: Préfixe du répertoire ('video', 'image', 'exports')
+            directory_mtime: Date du répertoire lue avant le parcours
+            files: Fichiers du répertoire (mtime, taille, chemin), triés par date
+        """
+        stats = self._stats_from_scan(files, prefix)
         
-        oldest_timestamp = float('inf')
-        oldest_file = None
-        newest_timestamp = 0
-        newest_file = None
+        with self._stats_lock:
+            self._dir_stats[prefix] = stats
+            if prefix in self._file_index:
+                extensions = self._listing_exts[prefix]
+                self._file_index[prefix] = self._index_from_scan(
+                    [file_info for file_info in files
+                     if os.path.splitext(file_info[2])[1].lower() in extensions])
+                self._file_index_mtime[prefix] = directory_mtime
+    
+    @staticmethod
+    def _directory_mtime(directory: str) -> Optional[float]:
+        """
+        Retourne la date de modification d'un répertoire (modifiée à chaque création ou
+        suppression de fichier)
         
+        Args:
+            directory: Répertoire
+            
+        Returns:
+            Date de modification, ou None si le répertoire est inaccessible
+        """
         try:
-            for filename in os.listdir(directory):
-                filepath = os.path.join(directory, filename)
-                
-                try:
-                    # Ignorer les sous-répertoires
-                    if os.path.isdir(filepath):
+            return os.stat(directory).st_mtime
+        except OSError:
+            return None
+    
+    def _scan_directory(self, directory: str,
+                        extensions: Optional[frozenset] = None) -> List[Tuple[float, int, str]]:
+        """
+        Parcourt un répertoire avec un seul stat par fichier
+        
+        Args:
+            directory: Répertoire à parcourir
+            extensions: Extensions retenues (en minuscules), filtrées avant le stat; None pour toutes
+            
+        Returns:
+            Liste des fichiers (mtime, taille, chemin), du plus ancien au plus récent
+        """
+        files = []
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Filtrage sur le nom, sans appel système
+                    if extensions is not None and os.path.splitext(entry.name)[1].lower() not in extensions:
                         continue
-                    
-                    # Taille du fichier
-                    try:
-                        file_size = os.path.getsize(filepath)
-                    except:
-                        file_size = 0
-                        
-                    stats[f'{prefix}_size'] += file_size
-                    stats[f'{prefix}_count'] += 1
-                    
-                    # Horodatage du fichier
                     try:
-                        file_timestamp = os.path.getmtime(filepath)
-                    except:
+                        # Ignorer les sous-répertoires
+                        if entry.is_dir():
+                            continue
+                        file_stat = entry.stat()
+                    except OSError:
                         continue
-                    
-                    # Fichier le plus ancien
-                    if file_timestamp < oldest_timestamp:
-                        oldest_timestamp = file_timestamp
-                        oldest_file = filepath
-                    
-                    # Fichier le plus récent
-                    if file_timestamp > newest_timestamp:
-                        newest_timestamp = file_timestamp
-                        newest_file = filepath
-                except Exception as file_error:
-                    self.logger.error(f"Erreur lors de l'analyse du fichier {filename}: {str(file_error)}")
-                    continue
+                    files.append((file_stat.st_mtime, file_stat.st_size, entry.path))
+        except FileNotFoundError:
+            pass
         except Exception as dir_error:
             self.logger.error(f"Erreur lors de l'analyse du répertoire {directory}: {str(dir_error)}")
         
-        if oldest_file:
+        files.sort(key=itemgetter(0))
+        return files
+    
+    @staticmethod
+    def _stats_from_scan(files: List[Tuple[float, int, str]], prefix: str) -> Dict[str, Any]:
+        """
+        Calcule les statistiques d'un répertoire à partir de son parcours trié
+        
+        Args:
+            files: Fichiers du répertoire (mtime, taille, chemin), triés par date
+            prefix: Préfixe pour les clés du dictionnaire de résultat
+            
+        Returns:
+            Dictionnaire des statistiques
+        """
+        stats = {
+            f'{prefix}_size': sum(file_info[1] for file_info in files),
+            f'{prefix}_count': len(files),
+            f'{prefix}_oldest': None,
+            f'{prefix}_newest': None
+        }
+        
+        if files:
             stats[f'{prefix}_oldest'] = {
-                'path': oldest_file,
-                'timestamp': datetime.fromtimestamp(oldest_timestamp).isoformat()
+                'path': files[0][2],
+                'timestamp': _iso_from_timestamp(files[0][0])
             }
-        
-        if newest_file:
             stats[f'{prefix}_newest'] = {
-                'path': newest_file,
-                'timestamp': datetime.fromtimestamp(newest_timestamp).isoformat()
+                'path': files[-1][2],
+                'timestamp': _iso_from_timestamp(files[-1][0])
             }
         
         return stats
     
+    @staticmethod
+    def _index_from_scan(files: List[Tuple[float, int, str]]) -> Tuple[List[float], List[Tuple[str, str, int]]]:
+        """
+        Construit l'index d'un répertoire à partir de son parcours trié
+        
+        Args:
+            files: Fichiers du répertoire (mtime, taille, chemin), triés par date
+            
+        Returns:
+            Tuple (dates de modification, liste des (chemin, nom, taille)) dans le même ordre
+        """
+        return ([file_info[0] for file_info in files],
+                [(file_info[2], os.path.basename(file_info[2]), file_info[1]) for file_info in files])
+    
+    def _get_directory_stats(self, directory: str, prefix: str) -> Dict[str, Any]:
+        """
+        Calcule les statistiques d'un répertoire
+        
+        Args:
+            directory: Répertoire à analyser
+            prefix: Préfixe pour les clés du dictionnaire de résultat
+            
+        Returns:
+            Dictionnaire des statistiques
+        """
+        return self._stats_from_scan(self._scan_directory(directory), prefix)
+    
     def export_detections(self, format: str, path: Optional[str] = None, 
                          start_date: Optional[datetime] = None, 
                          end_date: Optional[datetime] = None) -> Optional[str]:
@@ -608,8 +1273,10 @@ class StorageManager:
         Returns:
             Chemin du fichier exporté, ou None en cas d'erreur
         """
-        # Filtrer les détections par date si nécessaire
+        # Filtrer les détections par date si nécessaire (comparaison d'horodatages numériques)
         filtered_history = []
+        start_timestamp = start_date.timestamp() if start_date else None
+        end_timestamp = end_date.timestamp() if end_date else None
         
         for detection in self.detection_history:
             try:
@@ -617,12 +1284,12 @@ class StorageManager:
                 if not detection_time_str:
                     continue
                     
-                detection_time = datetime.fromisoformat(detection_time_str)
+                detection_timestamp = _entry_timestamp(detection)
                 
-                if start_date and detection_time < start_date:
+                if start_timestamp is not None and detection_timestamp < start_timestamp:
                     continue
                 
-                if end_date and detection_time > end_date:
+                if end_timestamp is not None and detection_timestamp > end_timestamp:
                     continue
                 
                 filtered_history.append(detection)
@@ -641,8 +1308,8 @@ class StorageManager:
             filename = f"detections_{timestamp}.{format}"
             
             try:
-                os.makedirs(self.exports_dir, exist_ok=True)
-                path = os.path.join(self.exports_dir, filename)
+                self._ensure_dir(self.exports_dir)
+                path = self._exports_prefix + filename
             except Exception as dir_error:
                 self.logger.error(f"Erreur lors de la création du répertoire d'exports: {str(dir_error)}")
                 # Utiliser un répertoire temporaire
@@ -656,6 +1323,9 @@ class StorageManager:
             if parent_dir:
                 os.makedirs(parent_dir, exist_ok=True)
             
+            # Nouveau fichier d'export: statistiques recalculées au prochain appel
+            self._invalidate_directory('exports')
+            
             # Exporter selon le format demandé
             if format.lower() == 'csv':
                 return self._export_csv(filtered_history, path)
@@ -681,48 +1351,33 @@ class StorageManager:
             Chemin du fichier exporté
         """
         try:
-            # Déterminer les colonnes
-            columns = set()
-            for detection in detections:
-                columns.update(detection.keys())
-            
-            # Éliminer les colonnes complexes (listes, dictionnaires)
-            columns_to_remove = []
-            for col in columns:
-                for detection in detections:
-                    if col in detection and isinstance(detection[col], (list, dict, tuple)):
-                        columns_to_remove.append(col)
-                        break
-            
-            # Suppression des colonnes complexes
-            for col in columns_to_remove:
-                columns.discard(col)
-            
-            # Assurer que les colonnes importantes sont présentes et dans un ordre logique
-            ordered_columns = ['time', 'zone', 'class_name', 'confidence']
-            
-            # Ajouter les autres colonnes
-            for col in sorted(columns):
-                if col not in ordered_columns:
-                    ordered_columns.append(col)
+            # Schéma configuré: colonnes utilisées telles quelles, sans passe de découverte
+            ordered_columns = self.storage_config.get('csv_schema')
             
-            # Éliminer les colonnes inexistantes
-            ordered_columns = [col for col in ordered_columns if col in columns]
-            
-            with open(path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=ordered_columns)
-                writer.writeheader()
-                
+            if not ordered_columns:
+                # Déterminer les colonnes en une seule passe (ordre d'apparition conservé)
+                # et repérer les colonnes complexes (listes, dictionnaires) à éliminer
+                columns = {}
+                complex_columns = set()
                 for detection in detections:
-                    # Assurer que toutes les colonnes sont présentes
-                    row = {}
-                    for col in ordered_columns:
-                        value = detection.get(col, '')
-                        # Convertir en chaîne si nécessaire
-                        if not isinstance(value, (str, int, float, bool, type(None))):
-                            value = str(value)
-                        row[col] = value
-                    writer.writerow(row)
+                    for col, value in detection.items():
+                        if col not in columns:
+                            columns[col] = None
+                        if isinstance(value, (list, dict, tuple)):
+                            complex_columns.add(col)
+                
+                # Colonnes importantes en premier, puis les autres dans leur ordre d'apparition
+                priority_columns = ('time', 'zone', 'class_name', 'confidence')
+                ordered_columns = [col for col in priority_columns if col in columns and col not in complex_columns]
+                ordered_columns.extend(col for col in columns
+                                       if col not in priority_columns and col not in complex_columns)
+            
+            with open(path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                # Le module csv convertit lui-même les valeurs en chaîne (None -> '')
+                writer = csv.writer(f)
+                writer.writerow(ordered_columns)
+                writer.writerows([detection.get(col, '') for col in ordered_columns]
+                                 for detection in detections)
             
             self.logger.info(f"Export CSV créé: {path} ({len(detections)} détections)")
             return path
@@ -741,44 +1396,52 @@ class StorageManager:
         Returns:
             Chemin du fichier exporté
         """
+        temp_path = f"{path}.tmp"
         try:
-            # Nettoyer les objets non sérialisables
-            clean_detections = []
-            for detection in detections:
-                clean_detection = {}
-                for key, value in detection.items():
-                    # Si valeur est un objet numpy, le convertir en liste
-                    if hasattr(value, 'tolist'):
-                        clean_detection[key] = value.tolist()
-                    # Si valeur est un objet personnalisé, le convertir en chaîne
-                    elif not isinstance(value, (str, int, float, bool, list, dict, tuple, type(None))):
-                        clean_detection[key] = str(value)
-                    else:
-                        clean_detection[key] = value
-                clean_detections.append(clean_detection)
-            
-            # Écrire dans un fichier temporaire d'abord (pour éviter la corruption)
-            temp_path = f"{path}.tmp"
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(clean_detections, f, indent=2)
-            
-            # Vérifier que le fichier a bien été créé
-            if os.path.exists(temp_path):
-                # Remplacer le fichier de destination
-                if os.path.exists(path):
-                    os.replace(temp_path, path)
-                else:
-                    os.rename(temp_path, path)
+            # Écrire dans un fichier temporaire d'abord (pour éviter la corruption), entrée par
+            # entrée: une seule détection nettoyée et sérialisée en mémoire à la fois
+            with open(temp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                separator = b'[\n  '
+                for detection in detections:
+                    # Nettoyer les objets non sérialisables
+                    clean_detection = {}
+                    for key, value in detection.items():
+                        # Cas courant: valeur déjà sérialisable
+                        if type(value) in _SAFE_TYPES_SET:
+                            clean_detection[key] = value
+                        # Si valeur est un objet numpy, le convertir en liste
+                        elif hasattr(value, 'tolist'):
+                            clean_detection[key] = value.tolist()
+                        # Si valeur est un objet personnalisé, le convertir en chaîne
+                        elif not isinstance(value, _SAFE_TYPES):
+                            clean_detection[key] = str(value)
+                        else:
+                            clean_detection[key] = value
+                    
+                    # Indentation d'un niveau supplémentaire (élément du tableau)
+                    f.write(separator)
+                    f.write(_json_dumps(clean_detection, indent=True).replace(b'\n', b'\n  '))
+                    separator = b',\n  '
+                
+                f.write(b'[]' if separator == b'[\n  ' else b'\n]')
+                # Données sur disque avant le renommage (sinon fichier vide possible après coupure)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            # Remplacer le fichier de destination (renommage atomique)
+            os.replace(temp_path, path)
             
             self.logger.info(f"Export JSON créé: {path} ({len(detections)} détections)")
             return path
         except Exception as e:
             self.logger.error(f"Erreur lors de l'export JSON: {str(e)}")
+            _discard_temp_file(temp_path)
             raise
     
     def get_file_list(self, file_type: str = 'all', 
                     start_date: Optional[datetime] = None, 
-                    end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+                    end_date: Optional[datetime] = None,
+                    limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Retourne une liste de fichiers filtrée
         
@@ -786,9 +1449,10 @@ class StorageManager:
             file_type: Type de fichier ('video', 'image', 'all')
             start_date: Date de début pour le filtrage
             end_date: Date de fin pour le filtrage
+            limit: Nombre maximal de fichiers retournés (les plus récents), None pour tous
             
         Returns:
-            Liste des fichiers
+            Liste des fichiers, du plus récent au plus ancien
         """
         files = []
         
@@ -796,62 +1460,73 @@ class StorageManager:
             # Déterminer les répertoires à parcourir
             directories = []
             if file_type == 'video' or file_type == 'all':
-                if os.path.exists(self.videos_dir):
-                    directories.append((self.videos_dir, 'video'))
+                directories.append((self.videos_dir, 'video'))
             if file_type == 'image' or file_type == 'all':
-                if os.path.exists(self.images_dir):
-                    directories.append((self.images_dir, 'image'))
+                directories.append((self.images_dir, 'image'))
             
             # Filtrer par date
             start_timestamp = start_date.timestamp() if start_date else 0
             end_timestamp = end_date.timestamp() if end_date else float('inf')
             
+            # Un seul stat par répertoire pour valider les index
+            directory_mtimes = {type_name: self._directory_mtime(directory)
+                                for directory, type_name in directories}
+            with self._stats_lock:
+                stale = [(directory, type_name) for directory, type_name in directories
+                         if self._file_index[type_name] is None
+                         or self._file_index_mtime[type_name] != directory_mtimes[type_name]]
+            
+            # Parcours des répertoires à réindexer, en parallèle hors du verrou
+            if len(stale) > 1:
+                with ThreadPoolExecutor(max_workers=len(stale), thread_name_prefix='storage-scan') as pool:
+                    scans = dict(zip([type_name for _, type_name in stale],
+                                     pool.map(self._scan_directory,
+                                              [directory for directory, _ in stale],
+                                              [self._listing_exts[type_name] for _, type_name in stale])))
+            else:
+                scans = {type_name: self._scan_directory(directory, self._listing_exts[type_name])
+                         for directory, type_name in stale}
+            
+            with self._stats_lock:
+                for type_name, scan in scans.items():
+                    self._file_index[type_name] = self._index_from_scan(scan)
+                    self._file_index_mtime[type_name] = directory_mtimes[type_name]
+            
             for directory, type_name in directories:
-                try:
-                    for filename in os.listdir(directory):
-                        filepath = os.path.join(directory, filename)
-                        
-                        try:
-                            # Ignorer les sous-répertoires
-                            if os.path.isdir(filepath):
-                                continue
-                            
-                            # Obtenir l'horodatage du fichier
-                            try:
-                                file_timestamp = os.path.getmtime(filepath)
-                            except:
-                                continue
-                            
-                            # Filtrer par date
-                            if not (start_timestamp <= file_timestamp <= end_timestamp):
-                                continue
-                            
-                            # Obtenir la taille du fichier
-                            try:
-                                file_size = os.path.getsize(filepath)
-                            except:
-                                file_size = 0
-                            
-                            # Ajouter à la liste
-                            file_time = datetime.fromtimestamp(file_timestamp).isoformat()
-                            
-                            files.append({
-                                'path': filepath,
-                                'name': filename,
-                                'type': type_name,
-                                'size': file_size,
-                                'timestamp': file_time
-                            })
-                        except Exception as file_error:
-                            self.logger.error(f"Erreur lors de l'analyse du fichier {filename}: {str(file_error)}")
-                            continue
-                except Exception as dir_error:
-                    self.logger.error(f"Erreur lors de l'analyse du répertoire {directory}: {str(dir_error)}")
+                with self._stats_lock:
+                    index = self._file_index[type_name]
+                    if index is None:
+                        # Invalidé entre-temps
+                        index = self._index_from_scan(
+                            self._scan_directory(directory, self._listing_exts[type_name]))
+                        self._file_index[type_name] = index
+                        self._file_index_mtime[type_name] = directory_mtimes[type_name]
+                    
+                    # Recherche dichotomique des bornes dans l'index trié par date
+                    mtimes, entries = index
+                    low = bisect_left(mtimes, start_timestamp)
+                    high = bisect_right(mtimes, end_timestamp)
+                    
+                    # Seuls les plus récents de chaque répertoire peuvent figurer dans le résultat
+                    if limit is not None:
+                        low = max(low, high - limit)
+                    
+                    files.extend((file_timestamp, type_name, entry)
+                                 for file_timestamp, entry in zip(mtimes[low:high], entries[low:high]))
             
-            # Trier par date (récent d'abord)
-            files.sort(key=lambda x: x['timestamp'], reverse=True)
+            # Trier par date (récent d'abord), sur l'horodatage numérique
+            files.sort(key=itemgetter(0), reverse=True)
+            if limit is not None:
+                del files[limit:]
             
-            return files
+            # Mise en forme uniquement pour les fichiers retournés
+            return [{
+                'path': filepath,
+                'name': filename,
+                'type': type_name,
+                'size': file_size,
+                'timestamp': _iso_from_timestamp(file_timestamp)
+            } for file_timestamp, type_name, (filepath, filename, file_size) in files]
         except Exception as e:
             self.logger.error(f"Erreur lors de la récupération de la liste des fichiers: {str(e)}")
             return []